@@ -551,15 +551,15 @@ def run_prototype(company_name):
     print(f"\nCompany: {company_name}")
     
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'data_processing'))
-    from prepare_linkedin_queries_sp500 import clean_director_name, clean_company_name, generate_search_query
+    from prepare_linkedin_queries_sp500 import clean_director_names, clean_company_names, generate_search_queries
     
     if not os.path.exists(SP500_DATA_PATH):
         print(f"\nÃƒÂ¢Ã‚ÂÃ…â€™ Data not found: {SP500_DATA_PATH}")
         return
     
     df = pd.read_csv(SP500_DATA_PATH)
-    df['director_name_clean'] = df['director_name'].apply(clean_director_name)
-    df['company_name_clean'] = df['company_name'].apply(clean_company_name)
+    df['director_name_clean'] = clean_director_names(df['director_name'])
+    df['company_name_clean'] = clean_company_names(df['company_name'])
     
     companies = df['company_name'].unique()
     matches = [c for c in companies if company_name.lower() in c.lower()]
@@ -580,7 +580,7 @@ def run_prototype(company_name):
     print(f"\nÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Selected: {selected}")
     
     company_df = df[df['company_name'] == selected].copy()
-    company_df['search_query'] = company_df.apply(generate_search_query, axis=1)
+    company_df['search_query'] = generate_search_queries(company_df)
     
     print(f"\nDirectors ({len(company_df)}):")
     for _, row in company_df.iterrows():
@@ -26,10 +26,14 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
 import time
+import hashlib
 import argparse
+import shutil
+import contextlib
 import pandas as pd
 import requests
 from datetime import datetime
@@ -56,11 +60,11 @@ if not GOOGLE_API_KEY or not GOOGLE_SEARCH_ENGINE_ID:
 
 # Import verification functions
 try:
-    from linkedin_verification import verify_director_match, verify_url_data
+    from linkedin_verification import verify_director_match, verify_url_data, print_verification_summary
 except ImportError:
     # If running from different directory, try adding current dir to path
     sys.path.insert(0, os.path.dirname(__file__))
-    from linkedin_verification import verify_director_match, verify_url_data
+    from linkedin_verification import verify_director_match, verify_url_data, print_verification_summary
 
 # =========================
 # Configuration
@@ -74,6 +78,13 @@ GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
 DELAY_BETWEEN_REQUESTS = 1.5
 SAVE_EVERY_N_QUERIES = 25
 
+# Batch file names, e.g. batch_001_queries.csv / batch_001_urls.csv
+_BATCH_QUERY_RE = re.compile(r'^batch_(\d{3,})_queries\.csv$')
+_BATCH_URL_RE = re.compile(r'^batch_(\d{3,})_urls\.csv$')
+
+IO_BUFFER_SIZE = 4 * 1024 * 1024
+CSV_CHUNKSIZE = 100_000
+
 
 # =========================
 # Google Search with Verification
@@ -251,8 +262,11 @@ def find_linkedin_urls_batch(queries_df, batch_name, delay=DELAY_BETWEEN_REQUEST
         if col not in queries_df.columns:
             queries_df[col] = None
     
-    found_count = queries_df['linkedin_url'].notna().sum()
-    verified_count = (queries_df['verified'] == True).sum()
+    # Column positions for the per-query result write, resolved once
+    result_cols = [queries_df.columns.get_loc(col) for col in new_cols[:-1]]
+    board_keywords_col = queries_df.columns.get_loc('matched_board_keywords')
+    
+    found_count, verified_count = count_found_verified(queries_df)
     quota_exceeded = False
     
     for i in range(start_from, total):
@@ -267,22 +281,24 @@ def find_linkedin_urls_batch(queries_df, batch_name, delay=DELAY_BETWEEN_REQUEST
         # Call with both name and company for comprehensive verification
         result = search_linkedin_profile(query, director_name=director_name, company_name=company_name)
         
-        # Store all result fields
-        queries_df.iloc[i, queries_df.columns.get_loc('linkedin_url')] = result['url']
-        queries_df.iloc[i, queries_df.columns.get_loc('linkedin_title')] = result['title']
-        queries_df.iloc[i, queries_df.columns.get_loc('search_status')] = result['status']
-        queries_df.iloc[i, queries_df.columns.get_loc('match_score')] = result.get('match_score')
-        queries_df.iloc[i, queries_df.columns.get_loc('verified')] = result.get('verified')
-        queries_df.iloc[i, queries_df.columns.get_loc('quality_flag')] = result.get('quality_flag')
-        queries_df.iloc[i, queries_df.columns.get_loc('match_type')] = result.get('match_type')
-        queries_df.iloc[i, queries_df.columns.get_loc('name_matched')] = result.get('name_matched')
-        queries_df.iloc[i, queries_df.columns.get_loc('company_matched')] = result.get('company_matched')
-        queries_df.iloc[i, queries_df.columns.get_loc('board_keyword_matched')] = result.get('board_keyword_matched', False)
+        # Store all result fields in one row write
+        queries_df.iloc[i, result_cols] = [
+            result['url'],
+            result['title'],
+            result['status'],
+            result.get('match_score'),
+            result.get('verified'),
+            result.get('quality_flag'),
+            result.get('match_type'),
+            result.get('name_matched'),
+            result.get('company_matched'),
+            result.get('board_keyword_matched', False),
+        ]
         
         # Store board keywords if present
         if result.get('matched_board_keywords'):
             keywords_str = ', '.join(result['matched_board_keywords'])
-            queries_df.iloc[i, queries_df.columns.get_loc('matched_board_keywords')] = keywords_str
+            queries_df.iloc[i, board_keywords_col] = keywords_str
         
         if result['url']:
             found_count += 1
@@ -301,8 +317,7 @@ def find_linkedin_urls_batch(queries_df, batch_name, delay=DELAY_BETWEEN_REQUEST
         if i < total - 1 and not quota_exceeded:
             time.sleep(delay)
     
-    found_count = queries_df['linkedin_url'].notna().sum()
-    verified_count = (queries_df['verified'] == True).sum()
+    found_count, verified_count = count_found_verified(queries_df)
     
     print(f"\n    âœ“ Completed: {found_count}/{total} URLs found ({100*found_count/total:.1f}%)")
     if found_count > 0:
@@ -314,6 +329,12 @@ def find_linkedin_urls_batch(queries_df, batch_name, delay=DELAY_BETWEEN_REQUEST
 # Batch Management
 # =========================
 
+def list_batch_files(directory, pattern):
+    """Return sorted (batch_num, filename) pairs for files in directory matching pattern."""
+    with os.scandir(directory) as it:
+        return sorted((int(m.group(1)), e.name) for e in it if (m := pattern.match(e.name)))
+
+
 def get_completed_batches():
     checkpoint_file = os.path.join(CHECKPOINT_PATH, "completed_batches.txt")
     if not os.path.exists(checkpoint_file):
@@ -334,7 +355,16 @@ def load_checkpoint(batch_num):
         return json.load(f)
 
 
-def save_batch_checkpoint(batch_num, df, queries_processed):
+def hash_file(path):
+    """SHA-256 of a file's contents, read in 1 MiB blocks."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def save_batch_checkpoint(batch_num, df, queries_processed, input_hash=None):
     os.makedirs(CHECKPOINT_PATH, exist_ok=True)
     progress_file = os.path.join(CHECKPOINT_PATH, f"batch_{batch_num:03d}_progress.csv")
     df.to_csv(progress_file, index=False)
@@ -344,7 +374,8 @@ def save_batch_checkpoint(batch_num, df, queries_processed):
             'batch_num': batch_num,
             'queries_processed': queries_processed,
             'timestamp': datetime.now().isoformat(),
-            'progress_file': progress_file
+            'progress_file': progress_file,
+            'input_hash': input_hash
         }, f)
 
 
@@ -360,8 +391,14 @@ def process_batch_file(batch_num, resume=True):
     print(f"{'='*60}")
     
     start_from = 0
+    input_hash = hash_file(batch_file)
     checkpoint = load_checkpoint(batch_num)
     
+    # Checkpoints from older runs have no hash; only a real mismatch invalidates
+    if checkpoint and checkpoint.get('input_hash') not in (None, input_hash):
+        print(f"    Batch input changed since last checkpoint, starting over")
+        checkpoint = None
+    
     if resume and checkpoint:
         start_from = checkpoint['queries_processed']
         progress_file = checkpoint['progress_file']
@@ -375,7 +412,7 @@ def process_batch_file(batch_num, resume=True):
         df = pd.read_csv(batch_file)
     
     def checkpoint_callback(current_df, queries_done):
-        save_batch_checkpoint(batch_num, current_df, queries_done)
+        save_batch_checkpoint(batch_num, current_df, queries_done, input_hash)
     
     df, quota_exceeded = find_linkedin_urls_batch(
         df, f"batch_{batch_num:03d}",
@@ -391,8 +428,7 @@ def process_batch_file(batch_num, resume=True):
     if not quota_exceeded:
         completion_file = os.path.join(CHECKPOINT_PATH, "completed_batches.txt")
         with open(completion_file, 'a') as f:
-            found = df['linkedin_url'].notna().sum()
-            verified = (df['verified'] == True).sum()
+            found, verified = count_found_verified(df)
             f.write(f"{batch_num},{datetime.now().isoformat()},{found},{len(df)},{verified}\n")
         
         # Clean up checkpoints
@@ -406,6 +442,20 @@ def process_batch_file(batch_num, resume=True):
     return df
 
 
+def count_found_verified(df):
+    """Return (URLs found, verified URLs) for a results frame."""
+    found = int(df['linkedin_url'].notna().sum())
+    if 'verified' not in df.columns:
+        return found, 0
+    return found, int(df['verified'].eq(True).sum())
+
+
+def write_csv(df, path):
+    """Write a DataFrame to CSV through a large stdio buffer."""
+    with open(path, 'w', buffering=IO_BUFFER_SIZE, newline='') as fh:
+        df.to_csv(fh, index=False, chunksize=CSV_CHUNKSIZE)
+
+
 def combine_all_results():
     print("\n" + "="*60)
     print("Combining all results...")
@@ -415,25 +465,45 @@ def combine_all_results():
         print("Ã¢ÂÅ’ Results directory not found!")
         return
     
-    all_files = sorted([f for f in os.listdir(RESULTS_PATH) if f.startswith('batch_') and f.endswith('_urls.csv')])
+    all_files = [name for _, name in list_batch_files(RESULTS_PATH, _BATCH_URL_RE)]
     
     if not all_files:
         print("Ã¢ÂÅ’ No batch result files found!")
         return
     
-    dfs = []
-    for f in all_files:
-        df = pd.read_csv(os.path.join(RESULTS_PATH, f))
-        dfs.append(df)
-        print(f"    Loaded: {f} ({len(df)} rows)")
-    
-    combined = pd.concat(dfs, ignore_index=True)
+    paths = [os.path.join(RESULTS_PATH, f) for f in all_files]
     output_path = os.path.join(RESULTS_PATH, "all_sp500_linkedin_urls.csv")
-    combined.to_csv(output_path, index=False)
+    
+    headers = set()
+    for path in paths:
+        with open(path, 'rb') as fh:
+            headers.add(fh.readline())
+    
+    if len(headers) == 1 and b'' not in headers:
+        # Identical schemas: append raw bytes, writing the header only once
+        with open(output_path, 'wb') as out:
+            out.write(headers.pop())
+            for f, path in zip(all_files, paths):
+                with open(path, 'rb') as src:
+                    src.readline()
+                    shutil.copyfileobj(src, out, IO_BUFFER_SIZE)
+                    src.seek(-1, os.SEEK_END)
+                    if src.read(1) != b'\n':
+                        out.write(b'\n')
+                print(f"    Appended: {f}")
+        combined = pd.read_csv(output_path, usecols=lambda c: c in ('linkedin_url', 'verified'))
+    else:
+        dfs = []
+        for f, path in zip(all_files, paths):
+            df = pd.read_csv(path)
+            dfs.append(df)
+            print(f"    Loaded: {f} ({len(df)} rows)")
+        
+        combined = pd.concat(dfs, ignore_index=True)
+        write_csv(combined, output_path)
     
     total = len(combined)
-    found = combined['linkedin_url'].notna().sum()
-    verified = (combined['verified'] == True).sum() if 'verified' in combined.columns else 0
+    found, verified = count_found_verified(combined)
     
     print(f"\nÃ¢Å“â€œ Combined {len(all_files)} files Ã¢â€ â€™ {output_path}")
     print(f"  Total: {total:,}, URLs: {found:,} ({100*found/total:.1f}%), Verified: {verified:,}")
@@ -448,7 +518,7 @@ def print_status():
         print(f"\nÃ¢ÂÅ’ Run prepare_linkedin_queries_sp500.py first.")
         return
     
-    batch_files = sorted([f for f in os.listdir(QUERIES_PATH) if f.startswith('batch_') and f.endswith('_queries.csv')])
+    batch_files = list_batch_files(QUERIES_PATH, _BATCH_QUERY_RE)
     
     if not batch_files:
         print("\nÃ¢ÂÅ’ No batch files found!")
@@ -460,8 +530,7 @@ def print_status():
     
     total_queries, total_found, total_verified = 0, 0, 0
     
-    for batch_file in batch_files:
-        batch_num = int(batch_file.split('_')[1])
+    for batch_num, batch_file in batch_files:
         df = pd.read_csv(os.path.join(QUERIES_PATH, batch_file))
         queries = len(df)
         total_queries += queries
@@ -470,8 +539,7 @@ def print_status():
             results_file = os.path.join(RESULTS_PATH, f"batch_{batch_num:03d}_urls.csv")
             if os.path.exists(results_file):
                 results_df = pd.read_csv(results_file)
-                found = results_df['linkedin_url'].notna().sum()
-                verified = (results_df['verified'] == True).sum() if 'verified' in results_df.columns else 0
+                found, verified = count_found_verified(results_df)
                 total_found += found
                 total_verified += verified
                 status = f"Ã¢Å“â€œ {found}/{queries} found, {verified} verified"
@@ -503,40 +571,67 @@ def run_verification_cmd(apply_filter=False):
         return
     
     print(f"\nLoading: {combined_file}")
-    df = pd.read_csv(combined_file)
-    print(f"Total records: {len(df):,}")
+    print(f"    Streaming in chunks of {CSV_CHUNKSIZE:,} rows")
+    
+    verified_file = os.path.join(RESULTS_PATH, "all_sp500_linkedin_urls_verified.csv")
+    tmp_file = combined_file + '.tmp'
+    
+    total, urls_found, verified_count = 0, 0, 0
+    unverified_count, no_url_count = 0, 0
+    quality_counts = {q: 0 for q in ('EXCELLENT', 'GOOD', 'WEAK', 'WRONG_PERSON', 'FAIR', 'NO_MATCH')}
+    
+    # Verification rewrites the combined file, so stream into a temp file and
+    # swap it in once every chunk has been processed
+    with open(tmp_file, 'w', buffering=IO_BUFFER_SIZE, newline='') as out, \
+            (open(verified_file, 'w', buffering=IO_BUFFER_SIZE, newline='')
+             if apply_filter else contextlib.nullcontext()) as out_filtered:
+        for n, chunk in enumerate(pd.read_csv(combined_file, chunksize=CSV_CHUNKSIZE)):
+            # Run verification (adds columns, doesn't filter yet)
+            chunk = verify_url_data(chunk, apply_filter=False, verbose=False)
+            
+            # Always save with verification columns (preserves URLs)
+            chunk.to_csv(out, index=False, header=(n == 0))
+            
+            has_url = chunk['linkedin_url'].notna()
+            searched = has_url & (chunk['search_status'] == 'found')
+            for flag, count in chunk.loc[searched, 'quality_flag'].value_counts().items():
+                quality_counts[flag] += count
+            no_url_count += len(chunk) - searched.sum()
+            
+            found, verified = count_found_verified(chunk)
+            total += len(chunk)
+            urls_found += found
+            verified_count += verified
+            
+            if apply_filter:
+                # Create a COPY for filtering, preserve original (shallow: under
+                # pandas' copy-on-write only the columns modified below get
+                # duplicated, and chunk has already been written out above)
+                chunk_filtered = chunk.copy(deep=False)
+                
+                # Null out unverified URLs in the copy
+                unverified_mask = (chunk_filtered['verified'] == False) & has_url
+                unverified_count += unverified_mask.sum()
+                
+                chunk_filtered.loc[unverified_mask, 'linkedin_url'] = None
+                chunk_filtered.loc[unverified_mask, 'search_status'] = 'unverified'
+                
+                # Save filtered version to NEW file (not overwriting original)
+                chunk_filtered.to_csv(out_filtered, index=False, header=(n == 0))
     
-    # Run verification (adds columns, doesn't filter yet)
-    df = verify_url_data(df, apply_filter=False)
+    os.replace(tmp_file, combined_file)
     
-    # Always save with verification columns (preserves URLs)
-    df.to_csv(combined_file, index=False)
+    print(f"Total records: {total:,}")
+    print_verification_summary(quality_counts, no_url_count, verified_count)
     print(f"\nÃ¢Å“â€œ Updated with verification columns: {combined_file}")
     
     if apply_filter:
-        # Create a COPY for filtering, preserve original
-        df_filtered = df.copy()
-        
-        # Null out unverified URLs in the copy
-        unverified_mask = (df_filtered['verified'] == False) & (df_filtered['linkedin_url'].notna())
-        unverified_count = unverified_mask.sum()
-        
-        df_filtered.loc[unverified_mask, 'linkedin_url'] = None
-        df_filtered.loc[unverified_mask, 'search_status'] = 'unverified'
-        
-        # Save filtered version to NEW file (not overwriting original)
-        verified_file = os.path.join(RESULTS_PATH, "all_sp500_linkedin_urls_verified.csv")
-        df_filtered.to_csv(verified_file, index=False)
         print(f"Ã¢Å“â€œ Saved filtered data to: {verified_file}")
         print(f"  ({unverified_count} unverified URLs removed)")
         print(f"\n  NOTE: Original file preserved with all URLs intact.")
         print(f"  Use the _verified.csv file for scraping.")
     
     # Summary
-    total = len(df)
-    urls_found = df['linkedin_url'].notna().sum()
-    verified_count = (df['verified'] == True).sum()
-    
     print(f"\n{'='*60}")
     print(f"Total: {total:,}, URLs: {urls_found:,}, Verified: {verified_count:,}")
     if urls_found > 0:
@@ -551,15 +646,14 @@ def run_prototype(company_name):
     print(f"\nCompany: {company_name}")
     
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'data_processing'))
-    from prepare_linkedin_queries_sp500 import clean_director_name, clean_company_name, generate_search_query
+    from prepare_linkedin_queries_sp500 import load_cleaned_directors
     
     if not os.path.exists(SP500_DATA_PATH):
         print(f"\nÃ¢ÂÅ’ Data not found: {SP500_DATA_PATH}")
         return
     
-    df = pd.read_csv(SP500_DATA_PATH)
-    df['director_name_clean'] = df['director_name'].apply(clean_director_name)
-    df['company_name_clean'] = df['company_name'].apply(clean_company_name)
+    # Cleaned names and search queries come from a Parquet cache
+    df = load_cleaned_directors(SP500_DATA_PATH)
     
     companies = df['company_name'].unique()
     matches = [c for c in companies if company_name.lower() in c.lower()]
@@ -580,7 +674,6 @@ def run_prototype(company_name):
     print(f"\nÃ¢Å“â€œ Selected: {selected}")
     
     company_df = df[df['company_name'] == selected].copy()
-    company_df['search_query'] = company_df.apply(generate_search_query, axis=1)
     
     print(f"\nDirectors ({len(company_df)}):")
     for _, row in company_df.iterrows():
@@ -606,8 +699,7 @@ def run_prototype(company_name):
     output = os.path.join(RESULTS_PATH, f"prototype_{safe_name}_urls.csv")
     company_df.to_csv(output, index=False)
     
-    found = company_df['linkedin_url'].notna().sum()
-    verified = (company_df['verified'] == True).sum()
+    found, verified = count_found_verified(company_df)
     print(f"\nÃ¢Å“â€¦ Done! {found}/{len(company_df)} found, {verified} verified")
     print(f"Saved: {output}")
 
@@ -654,22 +746,23 @@ Examples:
             print(f"Ã¢ÂÅ’ Run prepare_linkedin_queries_sp500.py first.")
             return
         
-        batch_files = sorted([f for f in os.listdir(QUERIES_PATH) if f.startswith('batch_') and f.endswith('_queries.csv')])
+        batch_files = list_batch_files(QUERIES_PATH, _BATCH_QUERY_RE)
         completed = get_completed_batches()
         resume = not args.no_resume
         
         if args.batch.lower() == 'all':
-            for i in range(1, len(batch_files) + 1):
-                if i in completed:
-                    print(f"\nSkipping batch {i} (done)")
-                    continue
+            pending = sorted({batch_num for batch_num, _ in batch_files} - completed)
+            skipped = len(batch_files) - len(pending)
+            if skipped:
+                print(f"\nSkipping {skipped} completed batches")
+            for i in pending:
                 result = process_batch_file(i, resume=resume)
                 if result is None:
                     break
                 if 'quota_exceeded' in result.get('search_status', pd.Series()).values:
                     print("\nÃ¢Å¡Â  Quota exceeded. Continue tomorrow.")
                     break
-                if i < len(batch_files):
+                if i != pending[-1]:
                     time.sleep(5)
             print_status()
             if len(get_completed_batches()) == len(batch_files):
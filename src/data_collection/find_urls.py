@@ -119,6 +119,34 @@ def detect_column(df, candidates, label):
 # Name Cleaning
 # =========================
 
+# Patterns are compiled once here; the cleaners run once per row
+GEN_SUFFIX_RE = re.compile(r"\b(Jr\.?|Sr\.?|I{1,3}|IV|V|VI|VII|VIII|2nd|3rd|4th)\b", re.IGNORECASE)
+
+# Applied in order, before stripping dots (so C.F.A. matches)
+CREDENTIAL_RES = [re.compile(cred, re.IGNORECASE) for cred in (
+    r"\bPh\.?D\.?\b", r"\bM\.?D\.?\b", r"\bMBA\b", r"\bM\.?B\.?A\.?\b",
+    r"\bCPA\b", r"\bC\.?P\.?A\.?\b", r"\bC\.?F\.?A\.?\b", r"\bCFA\b",
+    r"\bJ\.?D\.?\b", r"\bEsq\.?\b", r"\bP\.?E\.?\b", r"\bDr\.?\b",
+    r"\bKBE\b", r"\bAC\b", r"\bOBE\b", r"\bCBE\b",
+    # Spaced-out credentials (C F A, M B A, etc.)
+    r"\bC\s+F\s+A\b", r"\bM\s+B\s+A\b", r"\bC\s+P\s+A\b",
+)]
+
+COMPANY_SUFFIX_RES = [re.compile(suffix, re.IGNORECASE) for suffix in (
+    r"\s*,?\s*Inc\.?\s*$", r"\s*,?\s*Corp\.?\s*$",
+    r"\s*,?\s*Corporation\s*$", r"\s*,?\s*Ltd\.?\s*$",
+    r"\s*,?\s*LLC\s*$", r"\s*,?\s*L\.L\.C\.?\s*$",
+    r"\s*,?\s*PLC\s*$", r"\s*,?\s*Co\.?\s*$",
+    r"\s*,?\s*Company\s*$",
+)]
+
+NAME_PART_CREDENTIALS_RE = re.compile(r"\b(Ph\.?D\.?|M\.?D\.?|MBA|CPA|J\.?D\.?|Esq\.?)\b", re.IGNORECASE)
+PERIODS_RE = re.compile(r"\.+")
+COMMA_RE = re.compile(r"\s*,\s*")
+WHITESPACE_RE = re.compile(r"\s+")
+POSSESSIVE_RE = re.compile(r"'S\b")
+
+
 def clean_person_name(name):
     """
     Clean person names: remove credentials, preserve generational suffixes.
@@ -131,40 +159,28 @@ def clean_person_name(name):
     name = str(name).strip()
 
     # Preserve generational suffixes
-    gen_suffixes = r"\b(Jr\.?|Sr\.?|I{1,3}|IV|V|VI|VII|VIII|2nd|3rd|4th)\b"
-    gen_match = re.search(gen_suffixes, name, re.IGNORECASE)
+    gen_match = GEN_SUFFIX_RE.search(name)
     gen_suffix = gen_match.group(0) if gen_match else ""
 
     # Remove credentials BEFORE stripping dots (so C.F.A. matches)
-    credentials = [
-        r"\bPh\.?D\.?\b", r"\bM\.?D\.?\b", r"\bMBA\b", r"\bM\.?B\.?A\.?\b",
-        r"\bCPA\b", r"\bC\.?P\.?A\.?\b", r"\bC\.?F\.?A\.?\b", r"\bCFA\b",
-        r"\bJ\.?D\.?\b", r"\bEsq\.?\b", r"\bP\.?E\.?\b", r"\bDr\.?\b",
-        r"\bKBE\b", r"\bAC\b", r"\bOBE\b", r"\bCBE\b",
-    ]
-    for cred in credentials:
-        name = re.sub(cred, "", name, flags=re.IGNORECASE)
-
-    # Also catch spaced-out credentials (C F A, M B A, etc.)
-    name = re.sub(r"\bC\s+F\s+A\b", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bM\s+B\s+A\b", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bC\s+P\s+A\b", "", name, flags=re.IGNORECASE)
+    for cred in CREDENTIAL_RES:
+        name = cred.sub("", name)
 
     # Remove generational suffix temporarily
     if gen_suffix:
-        name = re.sub(gen_suffixes, "", name, flags=re.IGNORECASE)
+        name = GEN_SUFFIX_RE.sub("", name)
 
     # Clean up punctuation and whitespace
-    name = re.sub(r"\.+", " ", name)
-    name = re.sub(r"\s*,\s*", " ", name)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = PERIODS_RE.sub(" ", name)
+    name = COMMA_RE.sub(" ", name)
+    name = WHITESPACE_RE.sub(" ", name).strip()
 
     # Title case if all-uppercase (SEC format)
     if name == name.upper() and len(name) > 3:
         name = name.title()
 
     # Fix possessive mangling from title case (Carter'S → Carter's)
-    name = re.sub(r"'S\b", "'s", name)
+    name = POSSESSIVE_RE.sub("'s", name)
 
     # Restore suffix
     if gen_suffix:
@@ -183,22 +199,15 @@ def clean_company_name(name):
 
     name = str(name).strip()
 
-    suffixes = [
-        r"\s*,?\s*Inc\.?\s*$", r"\s*,?\s*Corp\.?\s*$",
-        r"\s*,?\s*Corporation\s*$", r"\s*,?\s*Ltd\.?\s*$",
-        r"\s*,?\s*LLC\s*$", r"\s*,?\s*L\.L\.C\.?\s*$",
-        r"\s*,?\s*PLC\s*$", r"\s*,?\s*Co\.?\s*$",
-        r"\s*,?\s*Company\s*$",
-    ]
-    for suffix in suffixes:
-        name = re.sub(suffix, "", name, flags=re.IGNORECASE)
+    for suffix in COMPANY_SUFFIX_RES:
+        name = suffix.sub("", name)
 
     # Title case if all-uppercase
     if name == name.upper() and len(name) > 3:
         name = name.title()
-        name = re.sub(r"'S\b", "'s", name)
+        name = POSSESSIVE_RE.sub("'s", name)
 
-    return re.sub(r"\s+", " ", name).strip()
+    return WHITESPACE_RE.sub(" ", name).strip()
 
 
 # =========================
@@ -275,9 +284,9 @@ def extract_name_parts(person_name):
         return {"first_names": [], "last_names": []}
 
     name = str(person_name).strip()
-    name = re.sub(r"\b(Ph\.?D\.?|M\.?D\.?|MBA|CPA|J\.?D\.?|Esq\.?)\b", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\.+", " ", name)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = NAME_PART_CREDENTIALS_RE.sub("", name)
+    name = PERIODS_RE.sub(" ", name)
+    name = WHITESPACE_RE.sub(" ", name).strip()
 
     parts = [p.strip() for p in name.split() if p.strip()]
     if not parts:
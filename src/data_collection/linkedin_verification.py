@@ -10,9 +10,256 @@ Usage:
     from linkedin_verification import verify_name_match, verify_url_data, extract_name_parts
 """
 
+import os
 import re
+import functools
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+__all__ = [
+    'NICKNAMES',
+    'BOARD_KEYWORDS',
+    'extract_name_parts',
+    'clean_company_name_for_matching',
+    'verify_name_match',
+    'verify_company_match',
+    'check_board_role_keywords',
+    'verify_name_and_company_match',
+    'verify_director_match',
+    'print_verification_summary',
+    'verify_url_data',
+    'run_verification_standalone',
+]
+
+
+# =========================
+# Precompiled patterns
+# =========================
+
+# Credentials and titles stripped from director names
+_CREDENTIALS_RE = re.compile(r'\b(Ph\.?D\.?|M\.?D\.?|MBA|M\.?B\.?A\.?|CPA|C\.?P\.?A\.?|J\.?D\.?|Esq\.?|B\.?A\.?|B\.?S\.?|M\.?S\.?|M\.?P\.?H\.?|KBE|AC|OBE|CBE)\b', re.IGNORECASE)
+_NON_WORD_RE = re.compile(r'[^\w\s-]')
+_WORD_TOKEN_RE = re.compile(r'\w+')
+
+# Name suffixes to exclude from last name
+_NAME_SUFFIXES = frozenset({'jr', 'sr', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', '2nd', '3rd', '4th'})
+
+# str.translate tables for single-character replacements. _NON_WORD_TABLE
+# covers ASCII only (derived from _NON_WORD_RE), so non-ASCII names still
+# go through the regex.
+_DOTS_TABLE = str.maketrans('.', ' ')
+_NON_WORD_TABLE = str.maketrans({c: ' ' for c in map(chr, range(128)) if _NON_WORD_RE.match(c)})
+
+# Company suffixes. Stripping these one at a time in this order removes a
+# trailing run in which later entries come first ("acme co inc" -> "acme",
+# but "acme inc co" -> "acme inc"), so a single end-anchored pattern with
+# the optional groups in reverse order gives the same result in one pass.
+_COMPANY_SUFFIXES = [
+    r'\s*,?\s*inc\.?\s*',
+    r'\s*,?\s*corp\.?\s*',
+    r'\s*,?\s*corporation\s*',
+    r'\s*,?\s*ltd\.?\s*',
+    r'\s*,?\s*llc\s*',
+    r'\s*,?\s*l\.l\.c\.?\s*',
+    r'\s*,?\s*plc\s*',
+    r'\s*,?\s*co\.?\s*',
+    r'\s*,?\s*company\s*',
+    r'\s*,?\s*limited\s*',
+    r'\s*,?\s*group\s*',
+]
+_COMPANY_SUFFIX_RE = re.compile(
+    ''.join(f'(?:{suffix})?' for suffix in reversed(_COMPANY_SUFFIXES)) + '$',
+    re.IGNORECASE
+)
+
+
+# =========================
+# Board keywords
+# =========================
+
+# Board-related keywords, in the order they are reported
+BOARD_KEYWORDS = (
+    'board member',
+    'board of directors',
+    'board director',
+    'independent director',
+    'non-executive director',
+    'outside director',
+    'board',
+    'director',
+    'trustee',
+    'advisory board',
+    'advisory council',
+    'governance',
+    'chairman',
+    'chairwoman',
+    'chairperson',
+    'vice chair',
+    'lead director',
+    'presiding director'
+)
+
+
+# =========================
+# Nicknames
+# =========================
+
+# Common nickname mappings
+NICKNAMES = {
+    'robert': ['bob', 'rob', 'bobby', 'bert'],
+    'william': ['bill', 'will', 'billy', 'willy', 'liam'],
+    'richard': ['rick', 'dick', 'rich', 'ricky'],
+    'james': ['jim', 'jimmy', 'jamie'],
+    'timothy': ['tim', 'timmy'],
+    'thomas': ['tom', 'tommy'],
+    'michael': ['mike', 'mick', 'mickey'],
+    'joseph': ['joe', 'joey'],
+    'christopher': ['chris', 'kit'],
+    'anthony': ['tony', 'ant'],
+    'steven': ['steve', 'stevie'],
+    'stephen': ['steve', 'stevie'],
+    'edward': ['ed', 'eddie', 'ted', 'teddy'],
+    'charles': ['charlie', 'chuck', 'chas'],
+    'daniel': ['dan', 'danny'],
+    'matthew': ['matt', 'matty'],
+    'andrew': ['andy', 'drew'],
+    'david': ['dave', 'davey'],
+    'kenneth': ['ken', 'kenny'],
+    'ronald': ['ron', 'ronny', 'ronnie'],
+    'donald': ['don', 'donny', 'donnie'],
+    'raymond': ['ray'],
+    'lawrence': ['larry', 'lars'],
+    'nicholas': ['nick', 'nicky'],
+    'benjamin': ['ben', 'benny', 'benji'],
+    'samuel': ['sam', 'sammy'],
+    'gregory': ['greg', 'gregg'],
+    'patrick': ['pat', 'paddy'],
+    'alexander': ['alex', 'al', 'xander'],
+    'albert': ['al', 'bert', 'bertie'],
+    'frederick': ['fred', 'freddy', 'freddie'],
+    'gerald': ['jerry', 'gerry'],
+    'harold': ['harry', 'hal'],
+    'jeffrey': ['jeff', 'geoff'],
+    'jonathan': ['jon', 'john', 'jonny'],
+    'peter': ['pete'],
+    'phillip': ['phil'],
+    'philip': ['phil'],
+    'stanley': ['stan'],
+    'theodore': ['ted', 'teddy', 'theo'],
+    'walter': ['walt', 'wally'],
+    'elizabeth': ['liz', 'lizzy', 'beth', 'betty', 'eliza'],
+    'margaret': ['maggie', 'meg', 'peggy', 'marge'],
+    'catherine': ['cathy', 'kate', 'katie', 'cat'],
+    'katherine': ['kathy', 'kate', 'katie', 'kat'],
+    'patricia': ['pat', 'patty', 'trish'],
+    'jennifer': ['jen', 'jenny'],
+    'jessica': ['jess', 'jessie'],
+    'susan': ['sue', 'susie', 'suzy'],
+    'rebecca': ['becky', 'becca'],
+    'barbara': ['barb', 'barbie', 'babs'],
+    'dorothy': ['dot', 'dotty', 'dottie'],
+    'deborah': ['deb', 'debbie'],
+    'nancy': ['nan'],
+    'carolyn': ['carol', 'carrie'],
+    'christine': ['chris', 'christy', 'tina'],
+    'virginia': ['ginny', 'ginger'],
+    'jacqueline': ['jackie', 'jacqui'],
+    'millard': ['mickey'],  # Millard "Mickey" Drexler
+}
+
+
+def _build_first_name_variants():
+    """Map every formal name and nickname to its full list of variants."""
+    nick_to_formals = {}
+    for formal, nicks in NICKNAMES.items():
+        for nick in nicks:
+            nick_to_formals.setdefault(nick, []).append(formal)
+    
+    variants = {}
+    for name in [*NICKNAMES, *nick_to_formals]:
+        # Name itself, its nicknames, then any formal names it is a nickname of
+        first_names = [name] + NICKNAMES.get(name, [])
+        for formal in nick_to_formals.get(name, []):
+            if formal not in first_names:
+                first_names.append(formal)
+        variants[name] = tuple(first_names)
+    return variants
+
+
+# Read-only: one dict lookup per first name, no scan of NICKNAMES at match time
+_FIRST_NAME_VARIANTS = MappingProxyType(_build_first_name_variants())
+
+
+@functools.lru_cache(maxsize=None)
+def _word_re(token):
+    """Compiled whole-word pattern for a name/company token."""
+    return re.compile(r'\b' + re.escape(token) + r'\b')
+
+
+def _title_words(title_lower):
+    """All words in a lowercased title, collected in one sweep."""
+    return set(_WORD_TOKEN_RE.findall(title_lower))
+
+
+@functools.lru_cache(maxsize=None)
+def _is_plain_word(token):
+    """True if token is a single run of word characters."""
+    return _WORD_TOKEN_RE.fullmatch(token) is not None
+
+
+def _has_word(token, title_lower, title_words):
+    """
+    Whole-word match of token in the title.
+    
+    A plain word matches exactly when it is one of the title's words, so only
+    tokens containing punctuation (e.g. "o'neil", "lee-chin") need a regex.
+    """
+    if token in title_words:
+        return True
+    if _is_plain_word(token):
+        return False
+    return _word_re(token).search(title_lower) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _punctuated_re(tokens):
+    """Whole-word alternation over the tokens that are not plain words, or None."""
+    punctuated = [token for token in tokens if not _is_plain_word(token)]
+    if not punctuated:
+        return None
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, punctuated)) + r')\b')
+
+
+def _matching_words(tokens, title_lower, title_words):
+    """
+    Tokens (a tuple, e.g. one director's first names) that appear as whole
+    words in the title, in token order.
+    
+    One search over all punctuated tokens decides whether any regex is needed;
+    usually none of them occur and set membership settles every token.
+    """
+    punctuated_re = _punctuated_re(tokens)
+    if punctuated_re is None or punctuated_re.search(title_lower) is None:
+        return (token for token in tokens if token in title_words)
+    return (token for token in tokens if _has_word(token, title_lower, title_words))
+
+
+# Distinct rows remembered by the per-row match caches
+MATCH_CACHE_SIZE = 200_000
+
+# Internal name match result; the public verify_* functions build the dicts
+_NameMatch = namedtuple('_NameMatch', 'matched_first matched_last')
+_NO_NAME_MATCH = _NameMatch(None, None)
+
 
 def extract_name_parts(director_name):
     """
@@ -27,120 +274,46 @@ def extract_name_parts(director_name):
     if pd.isna(director_name):
         return {'first_names': [], 'last_names': []}
     
+    first_names, last_names = _name_parts(str(director_name))
+    return {'first_names': list(first_names), 'last_names': list(last_names)}
+
+
+@functools.lru_cache(maxsize=None)
+def _name_parts(name):
+    """Cached core of extract_name_parts, returning (first_names, last_names) tuples."""
     # Clean the name
-    name = str(director_name).strip()
+    name = name.strip()
     
     # Remove credentials and titles
-    name = re.sub(r'\b(Ph\.?D\.?|M\.?D\.?|MBA|M\.?B\.?A\.?|CPA|C\.?P\.?A\.?|J\.?D\.?|Esq\.?|B\.?A\.?|B\.?S\.?|M\.?S\.?|M\.?P\.?H\.?|KBE|AC|OBE|CBE)\b', '', name, flags=re.IGNORECASE)
-    
-    # Remove extra dots and clean up
-    name = re.sub(r'\.+', ' ', name)
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _CREDENTIALS_RE.sub('', name)
     
-    # Split into parts
-    parts = [p.strip() for p in name.split() if p.strip()]
+    # Remove dots and split into parts (split() also collapses whitespace)
+    parts = name.translate(_DOTS_TABLE).split()
     
     if not parts:
-        return {'first_names': [], 'last_names': []}
-    
-    # Identify suffixes to exclude from last name
-    suffixes = {'jr', 'sr', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', '2nd', '3rd', '4th'}
+        return (), ()
     
     # First name is always first part
     first_name = parts[0].lower()
     
-    # Build list of first name variations (nicknames)
-    first_names = [first_name]
-    
-    # Common nickname mappings
-    nicknames = {
-        'robert': ['bob', 'rob', 'bobby', 'bert'],
-        'william': ['bill', 'will', 'billy', 'willy', 'liam'],
-        'richard': ['rick', 'dick', 'rich', 'ricky'],
-        'james': ['jim', 'jimmy', 'jamie'],
-        'timothy': ['tim', 'timmy'],
-        'thomas': ['tom', 'tommy'],
-        'michael': ['mike', 'mick', 'mickey'],
-        'joseph': ['joe', 'joey'],
-        'christopher': ['chris', 'kit'],
-        'anthony': ['tony', 'ant'],
-        'steven': ['steve', 'stevie'],
-        'stephen': ['steve', 'stevie'],
-        'edward': ['ed', 'eddie', 'ted', 'teddy'],
-        'charles': ['charlie', 'chuck', 'chas'],
-        'daniel': ['dan', 'danny'],
-        'matthew': ['matt', 'matty'],
-        'andrew': ['andy', 'drew'],
-        'david': ['dave', 'davey'],
-        'kenneth': ['ken', 'kenny'],
-        'ronald': ['ron', 'ronny', 'ronnie'],
-        'donald': ['don', 'donny', 'donnie'],
-        'raymond': ['ray'],
-        'lawrence': ['larry', 'lars'],
-        'nicholas': ['nick', 'nicky'],
-        'benjamin': ['ben', 'benny', 'benji'],
-        'samuel': ['sam', 'sammy'],
-        'gregory': ['greg', 'gregg'],
-        'patrick': ['pat', 'paddy'],
-        'alexander': ['alex', 'al', 'xander'],
-        'albert': ['al', 'bert', 'bertie'],
-        'frederick': ['fred', 'freddy', 'freddie'],
-        'gerald': ['jerry', 'gerry'],
-        'harold': ['harry', 'hal'],
-        'jeffrey': ['jeff', 'geoff'],
-        'jonathan': ['jon', 'john', 'jonny'],
-        'peter': ['pete'],
-        'phillip': ['phil'],
-        'philip': ['phil'],
-        'stanley': ['stan'],
-        'theodore': ['ted', 'teddy', 'theo'],
-        'walter': ['walt', 'wally'],
-        'elizabeth': ['liz', 'lizzy', 'beth', 'betty', 'eliza'],
-        'margaret': ['maggie', 'meg', 'peggy', 'marge'],
-        'catherine': ['cathy', 'kate', 'katie', 'cat'],
-        'katherine': ['kathy', 'kate', 'katie', 'kat'],
-        'patricia': ['pat', 'patty', 'trish'],
-        'jennifer': ['jen', 'jenny'],
-        'jessica': ['jess', 'jessie'],
-        'susan': ['sue', 'susie', 'suzy'],
-        'rebecca': ['becky', 'becca'],
-        'barbara': ['barb', 'barbie', 'babs'],
-        'dorothy': ['dot', 'dotty', 'dottie'],
-        'deborah': ['deb', 'debbie'],
-        'nancy': ['nan'],
-        'carolyn': ['carol', 'carrie'],
-        'christine': ['chris', 'christy', 'tina'],
-        'virginia': ['ginny', 'ginger'],
-        'jacqueline': ['jackie', 'jacqui'],
-        'millard': ['mickey'],  # Millard "Mickey" Drexler
-    }
-    
-    if first_name in nicknames:
-        first_names.extend(nicknames[first_name])
-    
-    # Also check reverse (if we have a nickname, add formal name)
-    for formal, nicks in nicknames.items():
-        if first_name in nicks and formal not in first_names:
-            first_names.append(formal)
+    # Nickname variations (plus the formal name when we have a nickname)
+    first_names = _FIRST_NAME_VARIANTS.get(first_name, (first_name,))
     
     # Last name - skip suffixes
     last_names = []
-    for i in range(len(parts) - 1, 0, -1):
-        part = parts[i].lower()
-        if part not in suffixes and len(part) > 1:
+    for part in reversed(parts[1:]):
+        part = part.lower()
+        if part not in _NAME_SUFFIXES and len(part) > 1:
             last_names.append(part)
             break
     
     # For compound last names (de Rothschild, Van Dyke, etc.), also try the last word
     if len(parts) > 2:
         last_part = parts[-1].lower()
-        if last_part not in suffixes and last_part not in last_names and len(last_part) > 1:
+        if last_part not in _NAME_SUFFIXES and last_part not in last_names and len(last_part) > 1:
             last_names.append(last_part)
     
-    return {
-        'first_names': first_names,
-        'last_names': last_names
-    }
+    return first_names, tuple(last_names)
 
 
 def clean_company_name_for_matching(company_name):
@@ -156,30 +329,20 @@ def clean_company_name_for_matching(company_name):
     if pd.isna(company_name):
         return []
     
+    return list(_company_words(str(company_name)))
+
+
+@functools.lru_cache(maxsize=None)
+def _company_words(company_name):
+    """Cached core of clean_company_name_for_matching, returning a tuple."""
     # Remove common suffixes
-    name = str(company_name).lower()
-    suffixes = [
-        r'\s*,?\s*inc\.?\s*$',
-        r'\s*,?\s*corp\.?\s*$',
-        r'\s*,?\s*corporation\s*$',
-        r'\s*,?\s*ltd\.?\s*$',
-        r'\s*,?\s*llc\s*$',
-        r'\s*,?\s*l\.l\.c\.?\s*$',
-        r'\s*,?\s*plc\s*$',
-        r'\s*,?\s*co\.?\s*$',
-        r'\s*,?\s*company\s*$',
-        r'\s*,?\s*limited\s*$',
-        r'\s*,?\s*group\s*$',
-    ]
-    
-    for suffix in suffixes:
-        name = re.sub(suffix, '', name, flags=re.IGNORECASE)
-    
-    # Clean up and split
-    name = re.sub(r'[^\w\s-]', ' ', name)
-    name = re.sub(r'\s+', ' ', name).strip()
-    
-    # Split into words and filter
+    name = _COMPANY_SUFFIX_RE.sub('', company_name.lower())
+    
+    # Clean up and split into words (split() also collapses whitespace)
+    if name.isascii():
+        name = name.translate(_NON_WORD_TABLE)
+    else:
+        name = _NON_WORD_RE.sub(' ', name)
     words = name.split()
     
     # Remove common noise words
@@ -203,7 +366,7 @@ def clean_company_name_for_matching(company_name):
     if not significant_words and 2 <= len(company_name.strip()) <= 4:
         significant_words = [company_name.strip().lower()]
     
-    return significant_words
+    return tuple(significant_words)
 
 
 def verify_name_match(director_name, linkedin_title):
@@ -223,37 +386,7 @@ def verify_name_match(director_name, linkedin_title):
             - 'matched_first': str or None - which first name matched
             - 'matched_last': str or None - which last name matched
     """
-    if pd.isna(director_name) or pd.isna(linkedin_title):
-        return {
-            'verified': False,
-            'match_type': 'none',
-            'matched_first': None,
-            'matched_last': None
-        }
-    
-    # Get name parts
-    name_parts = extract_name_parts(director_name)
-    first_names = name_parts['first_names']
-    last_names = name_parts['last_names']
-    
-    # Clean and lowercase the title
-    title_lower = str(linkedin_title).lower()
-    
-    # Check for matches
-    matched_first = None
-    matched_last = None
-    
-    for fn in first_names:
-        # Use word boundary matching to avoid partial matches
-        # e.g., "Tim" should match "Tim Cook" but not "Optimization"
-        if re.search(r'\b' + re.escape(fn) + r'\b', title_lower):
-            matched_first = fn
-            break
-    
-    for ln in last_names:
-        if re.search(r'\b' + re.escape(ln) + r'\b', title_lower):
-            matched_last = ln
-            break
+    matched_first, matched_last = _match_name(director_name, linkedin_title)
     
     # Determine match type and verification status
     if matched_first and matched_last:
@@ -277,6 +410,34 @@ def verify_name_match(director_name, linkedin_title):
     }
 
 
+@functools.lru_cache(maxsize=MATCH_CACHE_SIZE)
+def _match_name(director_name, linkedin_title):
+    """
+    Core of verify_name_match, returning a _NameMatch instead of a dict.
+    
+    Cached: the same director/title pair recurs across batches and callers.
+    """
+    if pd.isna(director_name) or pd.isna(linkedin_title):
+        return _NO_NAME_MATCH
+    
+    # Clean and lowercase the title
+    title_lower = str(linkedin_title).lower()
+    return _match_name_lc(_name_parts(str(director_name)), title_lower,
+                          _title_words(title_lower))
+
+
+def _match_name_lc(name_parts, title_lower, title_words):
+    """_match_name for an already extracted name and lowercased title."""
+    first_names, last_names = name_parts
+    
+    # Whole-word matching (a set lookup for plain words) avoids partial matches
+    # e.g., "Tim" should match "Tim Cook" but not "Optimization"
+    matched_first = next(_matching_words(first_names, title_lower, title_words), None)
+    matched_last = next(_matching_words(last_names, title_lower, title_words), None)
+    
+    return _NameMatch(matched_first, matched_last)
+
+
 def verify_company_match(company_name, linkedin_title):
     """
     Verify if the company name appears in the LinkedIn profile title.
@@ -290,35 +451,33 @@ def verify_company_match(company_name, linkedin_title):
             - 'company_matched': bool - True if company appears in title
             - 'matched_words': list - which company words matched
     """
+    matched_words = _match_company(company_name, linkedin_title)
+    
+    # Company matches if ANY significant word appears
+    # (some companies have multiple words, we don't need all of them)
+    return {
+        'company_matched': len(matched_words) > 0,
+        'matched_words': list(matched_words)
+    }
+
+
+def _match_company(company_name, linkedin_title):
+    """Core of verify_company_match, returning the matched words as a tuple."""
     if pd.isna(company_name) or pd.isna(linkedin_title):
-        return {
-            'company_matched': False,
-            'matched_words': []
-        }
+        return ()
     
-    company_words = clean_company_name_for_matching(company_name)
+    company_words = _company_words(str(company_name))
     
     if not company_words:
-        return {
-            'company_matched': False,
-            'matched_words': []
-        }
+        return ()
     
     title_lower = str(linkedin_title).lower()
-    matched_words = []
-    
-    for word in company_words:
-        if re.search(r'\b' + re.escape(word) + r'\b', title_lower):
-            matched_words.append(word)
-    
-    # Company matches if ANY significant word appears
-    # (some companies have multiple words, we don't need all of them)
-    company_matched = len(matched_words) > 0
-    
-    return {
-        'company_matched': company_matched,
-        'matched_words': matched_words
-    }
+    return _match_company_lc(company_words, title_lower, _title_words(title_lower))
+
+
+def _match_company_lc(company_words, title_lower, title_words):
+    """_match_company for already cleaned company words and a lowercased title."""
+    return tuple(_matching_words(company_words, title_lower, title_words))
 
 
 def check_board_role_keywords(linkedin_title):
@@ -333,45 +492,171 @@ def check_board_role_keywords(linkedin_title):
             - 'has_board_keyword': bool
             - 'matched_keywords': list of matched keywords
     """
+    matched = _match_board_keywords(linkedin_title)
+    
+    return {
+        'has_board_keyword': len(matched) > 0,
+        'matched_keywords': list(matched)
+    }
+
+
+def _match_board_keywords(linkedin_title):
+    """Core of check_board_role_keywords, returning the matched keywords as a tuple."""
+    if pd.isna(linkedin_title):
+        return ()
+    
+    return _match_board_keywords_lc(str(linkedin_title).lower())
+
+
+def _match_board_keywords_lc(title_lower):
+    """_match_board_keywords for an already lowercased title."""
+    # Plain substring tests: 18 C-level `in` scans beat a regex alternation here
+    return tuple(keyword for keyword in BOARD_KEYWORDS if keyword in title_lower)
+
+
+@functools.lru_cache(maxsize=MATCH_CACHE_SIZE)
+def _match_all(director_name, company_name, linkedin_title):
+    """
+    Name, company and board keyword matches for one row.
+    
+    The title is lowercased and split into words once and shared by all three
+    checks instead of each check redoing it. Cached per (name, company, title)
+    since directors on several boards repeat the same triple.
+    """
     if pd.isna(linkedin_title):
-        return {
-            'has_board_keyword': False,
-            'matched_keywords': []
-        }
+        return _NO_NAME_MATCH, (), ()
     
     title_lower = str(linkedin_title).lower()
+    name_match, matched_words = _match_name_company_lc(
+        None if pd.isna(director_name) else director_name,
+        None if pd.isna(company_name) else company_name,
+        title_lower)
+    return name_match, matched_words, _match_board_keywords_lc(title_lower)
+
+
+def _match_name_company_lc(director_name, company_name, title_lower):
+    """
+    Name and company matches against an already lowercased title.
     
-    # Board-related keywords
-    board_keywords = [
-        'board member',
-        'board of directors',
-        'board director',
-        'independent director',
-        'non-executive director',
-        'outside director',
-        'board',
-        'director',
-        'trustee',
-        'advisory board',
-        'advisory council',
-        'governance',
-        'chairman',
-        'chairwoman',
-        'chairperson',
-        'vice chair',
-        'lead director',
-        'presiding director'
-    ]
-    
-    matched = []
-    for keyword in board_keywords:
-        if keyword in title_lower:
-            matched.append(keyword)
+    Callers handle NA: a missing name or company must be passed as None.
+    """
+    title_words = _title_words(title_lower)
     
-    return {
-        'has_board_keyword': len(matched) > 0,
-        'matched_keywords': matched
-    }
+    name_match = _NO_NAME_MATCH
+    if director_name is not None:
+        name_match = _match_name_lc(_name_parts(str(director_name)), title_lower, title_words)
+    
+    matched_words = ()
+    if company_name is not None:
+        matched_words = _match_company_lc(_company_words(str(company_name)),
+                                          title_lower, title_words)
+    
+    return name_match, matched_words
+
+
+def _board_keyword_hits(titles_lower):
+    """
+    Board keyword hits for many lowercased titles (None for a missing title),
+    as a bool array of shape (len(BOARD_KEYWORDS), len(titles_lower)).
+    
+    With pyarrow each keyword is one substring scan over the whole column of
+    titles; without it, falls back to the per-title `in` tests.
+    """
+    hits = np.zeros((len(BOARD_KEYWORDS), len(titles_lower)), dtype=bool)
+    if pa is None:
+        for u, title_lower in enumerate(titles_lower):
+            if title_lower is not None:
+                hits[:, u] = [keyword in title_lower for keyword in BOARD_KEYWORDS]
+        return hits
+    
+    titles = pa.array(titles_lower, type=pa.string())
+    for j, keyword in enumerate(BOARD_KEYWORDS):
+        hits[j] = pc.match_substring(titles, keyword).fill_null(False).to_numpy(zero_copy_only=False)
+    return hits
+
+
+# =========================
+# Scoring rules
+# =========================
+
+# verify_name_and_company_match outcomes: (match_score, quality_flag, match_type)
+_NAME_COMPANY_RULES = [
+    (100, 'EXCELLENT', 'full_name_and_company'),
+    (90, 'GOOD', 'full_name_no_company'),
+    (70, 'GOOD', 'partial_name_with_company'),
+    (60, 'WEAK', 'partial_name_no_company'),
+    (30, 'WRONG_PERSON', 'company_only_no_name'),
+    (0, 'NO_MATCH', 'no_match'),
+]
+
+
+def _name_company_rule(has_first, has_last, has_company):
+    """Index into _NAME_COMPANY_RULES for one combination of match signals."""
+    if has_first and has_last:
+        return 0 if has_company else 1
+    if has_first or has_last:
+        return 2 if has_company else 3
+    return 4 if has_company else 5
+
+
+# verify_director_match outcomes, in priority order
+_DIRECTOR_RULES = [
+    (100, 'EXCELLENT', 'full_name_board_keyword_company'),
+    (95, 'EXCELLENT', 'full_name_with_board_keyword'),
+    (90, 'GOOD', 'full_name_typical_director'),
+    (85, 'GOOD', 'partial_name_board_keyword_company'),
+    (80, 'GOOD', 'partial_name_with_board_keyword'),
+    (70, 'FAIR', 'full_name_company_no_board'),
+    (60, 'WEAK', 'partial_name_only'),
+    (30, 'WRONG_PERSON', 'company_only_no_name'),
+    (0, 'NO_MATCH', 'no_match'),
+]
+
+
+def _director_rule(has_first, has_last, has_company, has_board_keyword):
+    """Index into _DIRECTOR_RULES for one combination of match signals."""
+    if has_first and has_last and has_board_keyword and has_company:
+        return 0
+    elif has_first and has_last and has_board_keyword:
+        return 1
+    elif has_first and has_last:
+        return 2
+    elif (has_first or has_last) and has_board_keyword and has_company:
+        return 3
+    elif (has_first or has_last) and has_board_keyword:
+        return 4
+    elif has_first and has_last and has_company:
+        return 5
+    elif (has_first or has_last):
+        return 6
+    elif has_company:
+        return 7
+    return 8
+
+
+def _bits(idx, width):
+    """The bits of idx as bools, most significant first."""
+    return [bool(idx >> shift & 1) for shift in range(width - 1, -1, -1)]
+
+
+# Rule index for every combination of signals, looked up by bitmask instead
+# of walking the rule ladder: first<<2 | last<<1 | company, and
+# first<<3 | last<<2 | company<<1 | board_keyword for directors
+_NAME_COMPANY_RULE_TABLE = np.array(
+    [_name_company_rule(*_bits(idx, 3)) for idx in range(8)], dtype=np.intp)
+_DIRECTOR_RULE_TABLE = np.array(
+    [_director_rule(*_bits(idx, 4)) for idx in range(16)], dtype=np.intp)
+
+# Column-wise views of _DIRECTOR_RULES for verify_url_data
+_DIRECTOR_SCORES = np.array([rule[0] for rule in _DIRECTOR_RULES], dtype=np.int64)
+_DIRECTOR_FLAGS = np.array([rule[1] for rule in _DIRECTOR_RULES], dtype=object)
+
+# quality_flag / match_type are written as categoricals: a small integer code
+# per row instead of a string reference per row, and the same categories in
+# every chunk. Match type codes are the rule indices themselves.
+_QUALITY_FLAG_DTYPE = pd.CategoricalDtype(list(dict.fromkeys(_DIRECTOR_FLAGS)))
+_MATCH_TYPE_DTYPE = pd.CategoricalDtype([rule[2] for rule in _DIRECTOR_RULES])
+_DIRECTOR_FLAG_CODES = _QUALITY_FLAG_DTYPE.categories.get_indexer(_DIRECTOR_FLAGS)
 
 
 def verify_name_and_company_match(director_name, company_name, linkedin_title):
@@ -403,42 +688,18 @@ def verify_name_and_company_match(director_name, company_name, linkedin_title):
             - 'matched_company_words': list
             - 'quality_flag': str - 'EXCELLENT', 'GOOD', 'WEAK', 'WRONG_PERSON', 'NO_MATCH'
     """
-    # Get name matching results
-    name_result = verify_name_match(director_name, linkedin_title)
-    
-    # Get company matching results
-    company_result = verify_company_match(company_name, linkedin_title)
+    # Get name and company matching results
+    (matched_first, matched_last), matched_words, _ = _match_all(
+        director_name, company_name, linkedin_title)
     
     # Determine if we have first name, last name matches
-    has_first = name_result['matched_first'] is not None
-    has_last = name_result['matched_last'] is not None
-    has_company = company_result['company_matched']
+    has_first = matched_first is not None
+    has_last = matched_last is not None
+    has_company = len(matched_words) > 0
     
     # Calculate match score
-    if has_first and has_last and has_company:
-        match_score = 100
-        quality_flag = 'EXCELLENT'
-        match_type = 'full_name_and_company'
-    elif has_first and has_last and not has_company:
-        match_score = 90
-        quality_flag = 'GOOD'
-        match_type = 'full_name_no_company'
-    elif (has_first or has_last) and has_company:
-        match_score = 70
-        quality_flag = 'GOOD'
-        match_type = 'partial_name_with_company'
-    elif (has_first or has_last) and not has_company:
-        match_score = 60
-        quality_flag = 'WEAK'
-        match_type = 'partial_name_no_company'
-    elif not (has_first or has_last) and has_company:
-        match_score = 30
-        quality_flag = 'WRONG_PERSON'
-        match_type = 'company_only_no_name'
-    else:
-        match_score = 0
-        quality_flag = 'NO_MATCH'
-        match_type = 'no_match'
+    rule = _NAME_COMPANY_RULE_TABLE[has_first << 2 | has_last << 1 | has_company]
+    match_score, quality_flag, match_type = _NAME_COMPANY_RULES[rule]
     
     # Verification threshold: require name match AND company match
     # This means match_score >= 70 (at least partial name + company)
@@ -451,9 +712,9 @@ def verify_name_and_company_match(director_name, company_name, linkedin_title):
         'company_matched': has_company,
         'match_type': match_type,
         'quality_flag': quality_flag,
-        'matched_first': name_result['matched_first'],
-        'matched_last': name_result['matched_last'],
-        'matched_company_words': company_result['matched_words']
+        'matched_first': matched_first,
+        'matched_last': matched_last,
+        'matched_company_words': list(matched_words)
     }
 
 
@@ -504,58 +765,20 @@ def verify_director_match(director_name, company_name, linkedin_title):
     Returns:
         dict with match_score and detailed match information
     """
-    # Get name matching results
-    name_result = verify_name_match(director_name, linkedin_title)
-    
-    # Get company matching results (optional for directors)
-    company_result = verify_company_match(company_name, linkedin_title)
-    
-    # Get board role keywords
-    board_result = check_board_role_keywords(linkedin_title)
+    # Get name, company (optional for directors) and board keyword matches
+    (matched_first, matched_last), matched_words, matched_keywords = _match_all(
+        director_name, company_name, linkedin_title)
     
     # Determine match components
-    has_first = name_result['matched_first'] is not None
-    has_last = name_result['matched_last'] is not None
-    has_company = company_result['company_matched']
-    has_board_keyword = board_result['has_board_keyword']
+    has_first = matched_first is not None
+    has_last = matched_last is not None
+    has_company = len(matched_words) > 0
+    has_board_keyword = len(matched_keywords) > 0
     
     # Calculate match score for DIRECTORS
-    if has_first and has_last and has_board_keyword and has_company:
-        match_score = 100
-        quality_flag = 'EXCELLENT'
-        match_type = 'full_name_board_keyword_company'
-    elif has_first and has_last and has_board_keyword:
-        match_score = 95
-        quality_flag = 'EXCELLENT'
-        match_type = 'full_name_with_board_keyword'
-    elif has_first and has_last:
-        match_score = 90
-        quality_flag = 'GOOD'
-        match_type = 'full_name_typical_director'
-    elif (has_first or has_last) and has_board_keyword and has_company:
-        match_score = 85
-        quality_flag = 'GOOD'
-        match_type = 'partial_name_board_keyword_company'
-    elif (has_first or has_last) and has_board_keyword:
-        match_score = 80
-        quality_flag = 'GOOD'
-        match_type = 'partial_name_with_board_keyword'
-    elif has_first and has_last and has_company:
-        match_score = 70
-        quality_flag = 'FAIR'
-        match_type = 'full_name_company_no_board'
-    elif (has_first or has_last):
-        match_score = 60
-        quality_flag = 'WEAK'
-        match_type = 'partial_name_only'
-    elif has_company:
-        match_score = 30
-        quality_flag = 'WRONG_PERSON'
-        match_type = 'company_only_no_name'
-    else:
-        match_score = 0
-        quality_flag = 'NO_MATCH'
-        match_type = 'no_match'
+    rule = _DIRECTOR_RULE_TABLE[
+        has_first << 3 | has_last << 2 | has_company << 1 | has_board_keyword]
+    match_score, quality_flag, match_type = _DIRECTOR_RULES[rule]
     
     # Verification threshold for directors: 80+ (name match with board keyword OR full name)
     # This is lower than general verification because directors don't show board seats in titles
@@ -569,263 +792,111 @@ def verify_director_match(director_name, company_name, linkedin_title):
         'board_keyword_matched': has_board_keyword,
         'match_type': match_type,
         'quality_flag': quality_flag,
-        'matched_first': name_result['matched_first'],
-        'matched_last': name_result['matched_last'],
-        'matched_company_words': company_result['matched_words'],
-        'matched_board_keywords': board_result['matched_keywords']
-    }
-    """
-    Check if LinkedIn title contains board/director role keywords.
-    
-    Args:
-        linkedin_title: LinkedIn profile title
-    
-    Returns:
-        dict with:
-            - 'has_board_keyword': bool
-            - 'matched_keywords': list of matched keywords
-    """
-    if pd.isna(linkedin_title):
-        return {
-            'has_board_keyword': False,
-            'matched_keywords': []
-        }
-    
-    title_lower = str(linkedin_title).lower()
-    
-    # Board-related keywords
-    board_keywords = [
-        'board member',
-        'board of directors',
-        'board director',
-        'independent director',
-        'non-executive director',
-        'outside director',
-        'board',
-        'director',
-        'trustee',
-        'advisory board',
-        'advisory council',
-        'governance',
-        'chairman',
-        'chairwoman',
-        'chairperson',
-        'vice chair',
-        'lead director',
-        'presiding director'
-    ]
-    
-    matched = []
-    for keyword in board_keywords:
-        if keyword in title_lower:
-            matched.append(keyword)
-    
-    return {
-        'has_board_keyword': len(matched) > 0,
-        'matched_keywords': matched
+        'matched_first': matched_first,
+        'matched_last': matched_last,
+        'matched_company_words': list(matched_words),
+        'matched_board_keywords': list(matched_keywords)
     }
 
 
-def verify_director_match(director_name, company_name, linkedin_title):
+def print_verification_summary(quality_counts, no_url_count, verified_count,
+                               min_match_score=70, apply_filter=False):
     """
-    Verify LinkedIn profile match for BOARD DIRECTORS specifically.
-    
-    Directors typically work at other companies (employment) while serving on boards.
-    Their LinkedIn titles show their employment, NOT their board seats.
-    
-    Therefore, this function:
-    1. Prioritizes NAME matching (primary signal)
-    2. Checks for board role keywords (bonus signal)
-    3. Optionally checks company (rare but highest confidence)
-    
-    Match Score System for Directors:
-        100: Full name (first+last) + Board keyword + Company
-             (Rare - director lists board seat in title with company name)
-        
-         95: Full name (first+last) + Board keyword
-             (Strong - name matches and title mentions board role)
-        
-         90: Full name (first+last), no board keyword, no company
-             (Good - name matches, typical director profile showing employment)
-        
-         85: Partial name (first OR last) + Board keyword + Company
-             (Good - partial name but board role and company confirm)
-        
-         80: Partial name (first OR last) + Board keyword
-             (Fair - partial name but board keyword provides confidence)
-        
-         70: Full name + Company, no board keyword
-             (Fair - might be employee listing, not board seat)
-        
-         60: Partial name (first OR last), no board keyword, no company
-             (Weak - common names have high false positive risk)
-        
-         30: Company match only, no name match
-             (Wrong person - definitely incorrect)
-        
-          0: No matches at all
+    Print the quality breakdown produced by verify_url_data.
     
     Args:
-        director_name: Director's full name
-        company_name: Company where they serve as director
-        linkedin_title: LinkedIn profile title from search result
-    
-    Returns:
-        dict with match_score and detailed match information
+        quality_counts: dict mapping quality flag -> number of rows with a URL
+        no_url_count: number of rows without a found URL
+        verified_count: number of rows with verified == True
+        min_match_score: Minimum score used for verification
+        apply_filter: Whether low-score URLs were filtered out
     """
-    # Get name matching results
-    name_result = verify_name_match(director_name, linkedin_title)
-    
-    # Get company matching results (optional for directors)
-    company_result = verify_company_match(company_name, linkedin_title)
-    
-    # Get board role keywords
-    board_result = check_board_role_keywords(linkedin_title)
+    total_with_urls = sum(quality_counts.values())
     
-    # Determine match components
-    has_first = name_result['matched_first'] is not None
-    has_last = name_result['matched_last'] is not None
-    has_company = company_result['company_matched']
-    has_board_keyword = board_result['has_board_keyword']
+    print(f"\n    Results breakdown:")
+    print(f"    {'='*60}")
+    print(f"    {'Quality':<15} {'Score':<10} {'Count':<10} {'%':<10}")
+    print(f"    {'-'*60}")
     
-    # Calculate match score for DIRECTORS
-    if has_first and has_last and has_board_keyword and has_company:
-        match_score = 100
-        quality_flag = 'EXCELLENT'
-        match_type = 'full_name_board_keyword_company'
-    elif has_first and has_last and has_board_keyword:
-        match_score = 95
-        quality_flag = 'EXCELLENT'
-        match_type = 'full_name_with_board_keyword'
-    elif has_first and has_last:
-        match_score = 90
-        quality_flag = 'GOOD'
-        match_type = 'full_name_typical_director'
-    elif (has_first or has_last) and has_board_keyword and has_company:
-        match_score = 85
-        quality_flag = 'GOOD'
-        match_type = 'partial_name_board_keyword_company'
-    elif (has_first or has_last) and has_board_keyword:
-        match_score = 80
-        quality_flag = 'GOOD'
-        match_type = 'partial_name_with_board_keyword'
-    elif has_first and has_last and has_company:
-        match_score = 70
-        quality_flag = 'FAIR'
-        match_type = 'full_name_company_no_board'
-    elif (has_first or has_last):
-        match_score = 60
-        quality_flag = 'WEAK'
-        match_type = 'partial_name_only'
-    elif has_company:
-        match_score = 30
-        quality_flag = 'WRONG_PERSON'
-        match_type = 'company_only_no_name'
-    else:
-        match_score = 0
-        quality_flag = 'NO_MATCH'
-        match_type = 'no_match'
+    print(f"    {'EXCELLENT':<15} {'100':<10} {quality_counts['EXCELLENT']:<10} {100*quality_counts['EXCELLENT']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
+    print(f"    {'GOOD':<15} {'70-90':<10} {quality_counts['GOOD']:<10} {100*quality_counts['GOOD']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
+    print(f"    {'WEAK':<15} {'60':<10} {quality_counts['WEAK']:<10} {100*quality_counts['WEAK']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
+    print(f"    {'FAIR':<15} {'70':<10} {quality_counts['FAIR']:<10} {100*quality_counts['FAIR']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
+    print(f"    {'WRONG_PERSON':<15} {'30':<10} {quality_counts['WRONG_PERSON']:<10} {100*quality_counts['WRONG_PERSON']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
+    print(f"    {'NO_MATCH':<15} {'0':<10} {quality_counts['NO_MATCH']:<10} {100*quality_counts['NO_MATCH']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
+    print(f"    {'-'*60}")
+    print(f"    {'Total URLs':<15} {'':<10} {total_with_urls:<10} {'100.0%':<10}")
+    print(f"    {'No URL found':<15} {'':<10} {no_url_count:<10} {'':<10}")
     
-    # Verification threshold for directors: 80+ (name match with board keyword OR full name)
-    # This is lower than general verification because directors don't show board seats in titles
-    verified = match_score >= 80
+    print(f"\n    Ã¢Å“â€œ Verified (score >= {min_match_score}): {verified_count:,} ({100*verified_count/total_with_urls if total_with_urls > 0 else 0:.1f}%)")
     
-    return {
-        'match_score': match_score,
-        'verified': verified,
-        'name_matched': has_first or has_last,
-        'company_matched': has_company,
-        'board_keyword_matched': has_board_keyword,
-        'match_type': match_type,
-        'quality_flag': quality_flag,
-        'matched_first': name_result['matched_first'],
-        'matched_last': name_result['matched_last'],
-        'matched_company_words': company_result['matched_words'],
-        'matched_board_keywords': board_result['matched_keywords']
-    }
+    if apply_filter:
+        filtered_count = quality_counts['WEAK'] + quality_counts['WRONG_PERSON'] + quality_counts['NO_MATCH']
+        print(f"    Ã°Å¸Å¡Â« Filtered out (score < {min_match_score}): {filtered_count:,}")
+
+
+# Distinct (name, company, title) keys above which verify_url_data spreads
+# the name/company matching over worker processes; below it, process startup
+# costs more than it saves
+PARALLEL_MIN_KEYS = 50_000
+PARALLEL_SLICES_PER_WORKER = 4
+
+
+def _match_keys(keys):
     """
-    Comprehensive verification with numeric match score.
-    
-    Match Score System:
-        100: Perfect match (both first+last name AND company)
-         90: Full name match (first+last) but no company
-         70: Partial name match (first OR last) AND company
-         60: Partial name match (first OR last) but no company
-         30: Company match but no name match (WRONG PERSON)
-          0: No matches at all
-    
-    Args:
-        director_name: Director's full name
-        company_name: Company name
-        linkedin_title: LinkedIn profile title from search result
+    Name/company matching for a list of distinct (name, company, title) keys,
+    with missing values given as None.
     
-    Returns:
-        dict with:
-            - 'match_score': int (0-100) - numeric score indicating match quality
-            - 'verified': bool - True if match_score >= 70 (name + company)
-            - 'name_matched': bool - True if any name part matched
-            - 'company_matched': bool - True if company matched
-            - 'match_type': str - description of match type
-            - 'matched_first': str or None
-            - 'matched_last': str or None
-            - 'matched_company_words': list
-            - 'quality_flag': str - 'EXCELLENT', 'GOOD', 'WEAK', 'WRONG_PERSON', 'NO_MATCH'
+    Returns per-key arrays (has_first, has_last, has_company, matched_name,
+    matched_company, title_lower). Module-level so worker processes can run
+    it on a slice of the keys.
     """
-    # Get name matching results
-    name_result = verify_name_match(director_name, linkedin_title)
-    
-    # Get company matching results
-    company_result = verify_company_match(company_name, linkedin_title)
-    
-    # Determine if we have first name, last name matches
-    has_first = name_result['matched_first'] is not None
-    has_last = name_result['matched_last'] is not None
-    has_company = company_result['company_matched']
+    n_keys = len(keys)
+    key_first_name = np.full(n_keys, None, dtype=object)
+    key_last_name = np.full(n_keys, None, dtype=object)
+    key_company = np.zeros(n_keys, dtype=bool)
+    key_matched_company = np.full(n_keys, None, dtype=object)
+    key_titles_lower = np.full(n_keys, None, dtype=object)
+    
+    for u, (name, company, title) in enumerate(keys):
+        if title is None:
+            continue
+        key_titles_lower[u] = title_lower = str(title).lower()
+        (key_first_name[u], key_last_name[u]), matched_words = _match_name_company_lc(
+            name, company, title_lower)
+        
+        # Store matched company words
+        if matched_words:
+            key_company[u] = True
+            key_matched_company[u] = ', '.join(matched_words)
+    
+    # Build matched name strings column-wise: "first last", else whichever matched
+    key_first = np.not_equal(key_first_name, None)
+    key_last = np.not_equal(key_last_name, None)
+    key_matched_name = np.where(key_first, key_first_name, key_last_name)
+    both = key_first & key_last
+    key_matched_name[both] = key_first_name[both] + ' ' + key_last_name[both]
+    
+    return (key_first, key_last, key_company,
+            key_matched_name, key_matched_company, key_titles_lower)
+
+
+def _match_keys_parallel(keys):
+    """_match_keys over slices of keys, in one worker process per CPU."""
+    workers = os.cpu_count() or 1
     
-    # Calculate match score
-    if has_first and has_last and has_company:
-        match_score = 100
-        quality_flag = 'EXCELLENT'
-        match_type = 'full_name_and_company'
-    elif has_first and has_last and not has_company:
-        match_score = 90
-        quality_flag = 'GOOD'
-        match_type = 'full_name_no_company'
-    elif (has_first or has_last) and has_company:
-        match_score = 70
-        quality_flag = 'GOOD'
-        match_type = 'partial_name_with_company'
-    elif (has_first or has_last) and not has_company:
-        match_score = 60
-        quality_flag = 'WEAK'
-        match_type = 'partial_name_no_company'
-    elif not (has_first or has_last) and has_company:
-        match_score = 30
-        quality_flag = 'WRONG_PERSON'
-        match_type = 'company_only_no_name'
-    else:
-        match_score = 0
-        quality_flag = 'NO_MATCH'
-        match_type = 'no_match'
+    # A few slices per worker so one slow slice (long titles, punctuated
+    # names) does not leave the other workers idle at the end
+    size = -(-len(keys) // (workers * PARALLEL_SLICES_PER_WORKER))
+    slices = [keys[i:i + size] for i in range(0, len(keys), size)]
     
-    # Verification threshold: require name match AND company match
-    # This means match_score >= 70 (at least partial name + company)
-    verified = match_score >= 70
+    with ProcessPoolExecutor(max_workers=min(workers, len(slices))) as executor:
+        parts = list(executor.map(_match_keys, slices))
     
-    return {
-        'match_score': match_score,
-        'verified': verified,
-        'name_matched': has_first or has_last,
-        'company_matched': has_company,
-        'match_type': match_type,
-        'quality_flag': quality_flag,
-        'matched_first': name_result['matched_first'],
-        'matched_last': name_result['matched_last'],
-        'matched_company_words': company_result['matched_words']
-    }
+    return tuple(np.concatenate(arrays) for arrays in zip(*parts))
 
 
-def verify_url_data(df, apply_filter=False, min_match_score=70):
+def verify_url_data(df, apply_filter=False, min_match_score=70, verbose=True):
     """
     Verify all URLs in a DataFrame using comprehensive name+company matching.
     
@@ -833,6 +904,8 @@ def verify_url_data(df, apply_filter=False, min_match_score=70):
         df: DataFrame with 'director_name_clean', 'company_name_clean', and 'linkedin_title' columns
         apply_filter: If True, set linkedin_url to None for rows below min_match_score
         min_match_score: Minimum score to keep URLs (default 70 = partial name + company)
+        verbose: If False, skip the progress and breakdown printout (used when
+            verifying a file chunk by chunk; see print_verification_summary)
     
     Returns:
         DataFrame with verification columns added:
@@ -843,20 +916,95 @@ def verify_url_data(df, apply_filter=False, min_match_score=70):
             - name_matched: bool
             - company_matched: bool
     """
-    print("\n[Verification] Checking name+company matches in LinkedIn titles...")
-    print(f"    Minimum match score for verification: {min_match_score}")
+    if verbose:
+        print("\n[Verification] Checking name+company matches in LinkedIn titles...")
+        print(f"    Minimum match score for verification: {min_match_score}")
+    
+    n = len(df)
+    
+    def column_values(*names):
+        for name in names:
+            if name in df.columns:
+                return df[name].to_numpy(dtype=object)
+        return np.full(n, '', dtype=object)
+    
+    # Only rows with a found URL are scored
+    has_url = np.zeros(n, dtype=bool)
+    if 'linkedin_url' in df.columns and 'search_status' in df.columns:
+        has_url = (df['linkedin_url'].notna() & (df['search_status'] == 'found')).to_numpy()
+    rows = np.flatnonzero(has_url)
+    
+    # NA checks happen here, once per column: missing values become None so
+    # the per-row code below only needs identity tests
+    def na_to_none(values):
+        return np.where(pd.isna(values), None, values)
+    
+    names = na_to_none(column_values('director_name_clean', 'director_name')[rows])
+    companies = na_to_none(column_values('company_name_clean', 'company_name')[rows])
+    titles = na_to_none(column_values('linkedin_title')[rows])
+    
+    # Token matching (the only part that depends on each row's strings) runs
+    # once per distinct (name, company, title); directors on several boards
+    # and repeated search results reuse the first occurrence's result
+    key_ids = {}
+    codes = np.fromiter(
+        (key_ids.setdefault(key, len(key_ids)) for key in zip(names, companies, titles)),
+        dtype=np.intp, count=len(rows))
+    
+    keys = list(key_ids)
+    if len(keys) >= PARALLEL_MIN_KEYS and (os.cpu_count() or 1) > 1:
+        key_results = _match_keys_parallel(keys)
+    else:
+        key_results = _match_keys(keys)
+    (key_first, key_last, key_company,
+     key_matched_name, key_matched_company, key_titles_lower) = key_results
+    
+    # Board keywords are checked column-wise over all distinct titles at once
+    board_hits = _board_keyword_hits(key_titles_lower)
+    key_board = board_hits.any(axis=0)
+    key_matched_board = np.full(len(keys), None, dtype=object)
+    for u in np.flatnonzero(key_board):
+        key_matched_board[u] = ', '.join(
+            keyword for keyword, hit in zip(BOARD_KEYWORDS, board_hits[:, u]) if hit)
+    
+    # Broadcast back to rows
+    has_first = key_first[codes]
+    has_last = key_last[codes]
+    has_company = key_company[codes]
+    has_board = key_board[codes]
+    matched_name = np.full(n, None, dtype=object)
+    matched_company = np.full(n, None, dtype=object)
+    matched_board_keywords = np.full(n, None, dtype=object)
+    matched_name[rows] = key_matched_name[codes]
+    matched_company[rows] = key_matched_company[codes]
+    matched_board_keywords[rows] = key_matched_board[codes]
+    
+    # Director scoring (same rules as verify_director_match): look up each
+    # row's rule by its signal bitmask, then its score and match type
+    any_name = has_first | has_last
+    bits = (has_first.astype(np.intp) << 3 | has_last.astype(np.intp) << 2
+            | has_company.astype(np.intp) << 1 | has_board.astype(np.intp))
+    rule = _DIRECTOR_RULE_TABLE[bits]
+    scores = _DIRECTOR_SCORES[rule]
+    
+    def scatter(values, default, dtype):
+        out = np.full(n, default, dtype=dtype)
+        out[rows] = values
+        return out
     
     # Add verification columns
-    df['match_score'] = 0
-    df['verified'] = False
-    df['quality_flag'] = 'NO_MATCH'
-    df['match_type'] = 'no_match'
-    df['name_matched'] = False
-    df['company_matched'] = False
-    df['matched_name'] = None
-    df['matched_company'] = None
-    df['board_keyword_matched'] = False
-    df['matched_board_keywords'] = None
+    df['match_score'] = scatter(scores, 0, np.int64)
+    df['verified'] = scatter(scores >= 80, False, bool)
+    row_rule = scatter(rule, len(_DIRECTOR_RULES) - 1, np.intp)
+    df['quality_flag'] = pd.Categorical.from_codes(_DIRECTOR_FLAG_CODES[row_rule],
+                                                   dtype=_QUALITY_FLAG_DTYPE)
+    df['match_type'] = pd.Categorical.from_codes(row_rule, dtype=_MATCH_TYPE_DTYPE)
+    df['name_matched'] = scatter(any_name, False, bool)
+    df['company_matched'] = scatter(has_company, False, bool)
+    df['matched_name'] = matched_name
+    df['matched_company'] = matched_company
+    df['board_keyword_matched'] = scatter(has_board, False, bool)
+    df['matched_board_keywords'] = matched_board_keywords
     
     # Track counts by quality
     quality_counts = {
@@ -867,77 +1015,22 @@ def verify_url_data(df, apply_filter=False, min_match_score=70):
         'FAIR': 0,       # 70: full name + company, no board keyword
         'NO_MATCH': 0    # 0: nothing matched
     }
-    no_url_count = 0
-    
-    for idx, row in df.iterrows():
-        if pd.isna(row.get('linkedin_url')) or row.get('search_status') != 'found':
-            no_url_count += 1
-            continue
-        
-        # Get the verification result with match score
-        result = verify_director_match(
-            director_name=row.get('director_name_clean', row.get('director_name', '')),
-            company_name=row.get('company_name_clean', row.get('company_name', '')),
-            linkedin_title=row.get('linkedin_title', '')
-        )
-        
-        # Store results
-        df.at[idx, 'match_score'] = result['match_score']
-        df.at[idx, 'verified'] = result['verified']
-        df.at[idx, 'quality_flag'] = result['quality_flag']
-        df.at[idx, 'match_type'] = result['match_type']
-        df.at[idx, 'name_matched'] = result['name_matched']
-        df.at[idx, 'company_matched'] = result['company_matched']
-        df.at[idx, 'board_keyword_matched'] = result.get('board_keyword_matched', False)
-        
-        # Build matched name string
-        if result['matched_first'] and result['matched_last']:
-            df.at[idx, 'matched_name'] = f"{result['matched_first']} {result['matched_last']}"
-        elif result['matched_first']:
-            df.at[idx, 'matched_name'] = result['matched_first']
-        elif result['matched_last']:
-            df.at[idx, 'matched_name'] = result['matched_last']
-        
-        # Store matched company words
-        if result['matched_company_words']:
-            df.at[idx, 'matched_company'] = ', '.join(result['matched_company_words'])
-        
-        # Store matched board keywords
-        if result.get('matched_board_keywords'):
-            df.at[idx, 'matched_board_keywords'] = ', '.join(result['matched_board_keywords'])
-        
-        # Track quality counts
-        quality_counts[result['quality_flag']] += 1
-        
-        # Apply filter if requested
-        if apply_filter and result['match_score'] < min_match_score:
-            df.at[idx, 'linkedin_url'] = None
-            df.at[idx, 'search_status'] = 'filtered_low_score'
-    
-    # Print detailed summary
-    total_with_urls = sum(quality_counts.values())
-    
-    print(f"\n    Results breakdown:")
-    print(f"    {'='*60}")
-    print(f"    {'Quality':<15} {'Score':<10} {'Count':<10} {'%':<10}")
-    print(f"    {'-'*60}")
-    
-    print(f"    {'EXCELLENT':<15} {'100':<10} {quality_counts['EXCELLENT']:<10} {100*quality_counts['EXCELLENT']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
-    print(f"    {'GOOD':<15} {'70-90':<10} {quality_counts['GOOD']:<10} {100*quality_counts['GOOD']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
-    print(f"    {'WEAK':<15} {'60':<10} {quality_counts['WEAK']:<10} {100*quality_counts['WEAK']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
-    print(f"    {'FAIR':<15} {'70':<10} {quality_counts['FAIR']:<10} {100*quality_counts['FAIR']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
-    print(f"    {'WRONG_PERSON':<15} {'30':<10} {quality_counts['WRONG_PERSON']:<10} {100*quality_counts['WRONG_PERSON']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
-    print(f"    {'NO_MATCH':<15} {'0':<10} {quality_counts['NO_MATCH']:<10} {100*quality_counts['NO_MATCH']/total_with_urls if total_with_urls > 0 else 0:.1f}%")
-    print(f"    {'-'*60}")
-    print(f"    {'Total URLs':<15} {'':<10} {total_with_urls:<10} {'100.0%':<10}")
-    print(f"    {'No URL found':<15} {'':<10} {no_url_count:<10} {'':<10}")
-    
-    verified_count = (df['verified'] == True).sum()
-    print(f"\n    Ã¢Å“â€œ Verified (score >= {min_match_score}): {verified_count:,} ({100*verified_count/total_with_urls if total_with_urls > 0 else 0:.1f}%)")
-    
-    if apply_filter:
-        filtered_count = quality_counts['WEAK'] + quality_counts['WRONG_PERSON'] + quality_counts['NO_MATCH']
-        print(f"    Ã°Å¸Å¡Â« Filtered out (score < {min_match_score}): {filtered_count:,}")
+    flag_counts = np.bincount(_DIRECTOR_FLAG_CODES[rule],
+                              minlength=len(_QUALITY_FLAG_DTYPE.categories))
+    for flag, count in zip(_QUALITY_FLAG_DTYPE.categories, flag_counts):
+        quality_counts[flag] = int(count)
+    no_url_count = n - len(rows)
+    
+    # Apply filter if requested
+    if apply_filter and len(rows):
+        low_score = scatter(scores < min_match_score, False, bool)
+        df.loc[low_score, 'linkedin_url'] = None
+        df.loc[low_score, 'search_status'] = 'filtered_low_score'
+    
+    if verbose:
+        verified_count = (df['verified'] == True).sum()
+        print_verification_summary(quality_counts, no_url_count, verified_count,
+                                   min_match_score, apply_filter)
     
     return df
 
@@ -23,6 +23,7 @@ Usage:
 import os
 import sys
 import argparse
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -35,6 +36,10 @@ APIFY_DIR = "../../outputs/apify_inputs/"
 
 DEFAULT_THRESHOLD = 70  # Minimum match score for verification
 
+# Large stdio buffer and row chunks for CSV output
+IO_BUFFER_SIZE = 4 * 1024 * 1024
+CSV_CHUNKSIZE = 100_000
+
 
 # =========================
 # Helper Functions
@@ -49,7 +54,9 @@ def load_verified_data(input_path):
         sys.exit(1)
     
     print(f"Loading data from: {input_path}")
-    df = pd.read_csv(input_path)
+    # Multithreaded Arrow parser; columns still come back as regular pandas
+    # dtypes, so the statistics and the saved CSV are unaffected
+    df = pd.read_csv(input_path, engine='pyarrow')
     
     # Check for required columns
     required_cols = ['match_score', 'verified', 'linkedin_url']
@@ -64,22 +71,39 @@ def load_verified_data(input_path):
     return df
 
 
-def print_statistics(df, threshold):
-    """Print detailed statistics about the dataset."""
+def url_mask(df):
+    """Boolean array of rows that have a LinkedIn URL."""
+    return df['linkedin_url'].notna().to_numpy()
+
+
+def score_at_least(df, threshold):
+    """Boolean array of rows with match_score >= threshold (missing scores fail)."""
+    return (df['match_score'] >= threshold).to_numpy(dtype=bool, na_value=False)
+
+
+def print_statistics(df, threshold, has_url=None):
+    """
+    Print detailed statistics about the dataset.
+    
+    has_url: optional precomputed url_mask(df), shared with filter_verified
+    """
     print("\n" + "=" * 80)
     print("VERIFICATION STATISTICS")
     print("=" * 80)
     
+    if has_url is None:
+        has_url = url_mask(df)
+    
     total = len(df)
-    has_url = df['linkedin_url'].notna().sum()
-    no_url = df['linkedin_url'].isna().sum()
+    url_count = has_url.sum()
+    no_url = total - url_count
     
     print(f"\nTotal directors: {total:,}")
-    print(f"  URLs found: {has_url:,} ({100*has_url/total:.1f}%)")
+    print(f"  URLs found: {url_count:,} ({100*url_count/total:.1f}%)")
     print(f"  No URL found: {no_url:,} ({100*no_url/total:.1f}%)")
     
     # Score distribution for URLs that were found
-    df_with_urls = df[df['linkedin_url'].notna()]
+    df_with_urls = df[has_url]
     
     if len(df_with_urls) > 0:
         print(f"\n" + "-" * 80)
@@ -97,9 +121,15 @@ def print_statistics(df, threshold):
             (0, 29, "NO_MATCH (0-29)", "No match")
         ]
         
+        # Bucket every score in one pass (scores are integers, so each
+        # inclusive range is [min_score, max_score + 1) on the bin edges)
+        bins = [min_score for min_score, _, _, _ in reversed(score_ranges)] + [score_ranges[0][1] + 1]
+        labels = [label for _, _, label, _ in reversed(score_ranges)]
+        range_counts = pd.cut(df_with_urls['match_score'], bins=bins, labels=labels,
+                              right=False).value_counts()
+        
         for min_score, max_score, label, desc in score_ranges:
-            mask = (df_with_urls['match_score'] >= min_score) & (df_with_urls['match_score'] <= max_score)
-            count = mask.sum()
+            count = range_counts[label]
             if count > 0:
                 pct = 100 * count / len(df_with_urls)
                 print(f"  {label:<25} {count:>6,} ({pct:>5.1f}%) - {desc}")
@@ -125,12 +155,11 @@ def print_statistics(df, threshold):
     print(f"VERIFICATION AT THRESHOLD >= {threshold}")
     print("=" * 80)
     
-    verified = df[df['match_score'] >= threshold]
-    verified_with_url = verified[verified['linkedin_url'].notna()]
+    verified_with_url = df[has_url & score_at_least(df, threshold)]
     
     print(f"\nVerified directors (score >= {threshold}): {len(verified_with_url):,}")
     print(f"  Percentage of total: {100*len(verified_with_url)/total:.1f}%")
-    print(f"  Percentage of found URLs: {100*len(verified_with_url)/has_url:.1f}%")
+    print(f"  Percentage of found URLs: {100*len(verified_with_url)/url_count:.1f}%")
     
     # By company
     if 'company_name' in verified_with_url.columns:
@@ -144,15 +173,19 @@ def print_statistics(df, threshold):
             print(f"  {company:<40} {count:>3}")
 
 
-def filter_verified(df, threshold):
-    """Filter to verified directors with LinkedIn URLs."""
+def filter_verified(df, threshold, has_url=None):
+    """
+    Filter to verified directors with LinkedIn URLs.
+    
+    has_url: optional precomputed url_mask(df), shared with print_statistics
+    """
     print(f"\nFiltering to score >= {threshold}...")
     
+    if has_url is None:
+        has_url = url_mask(df)
+    
     # Filter: has URL AND meets threshold
-    verified = df[
-        (df['linkedin_url'].notna()) & 
-        (df['match_score'] >= threshold)
-    ].copy()
+    verified = df.iloc[np.flatnonzero(has_url & score_at_least(df, threshold))].copy()
     
     print(f"  Kept: {len(verified):,} directors")
     
@@ -172,7 +205,8 @@ def save_datasets(df_verified, threshold, output_dir, apify_dir):
     
     # 1. Full verified dataset (CSV)
     full_csv = os.path.join(output_dir, f"sp500_directors_verified_score{threshold}plus.csv")
-    df_verified.to_csv(full_csv, index=False)
+    with open(full_csv, 'w', buffering=IO_BUFFER_SIZE, encoding='utf-8', newline='') as f:
+        df_verified.to_csv(f, index=False, chunksize=CSV_CHUNKSIZE)
     print(f"\n✓ Full dataset: {full_csv}")
     print(f"  Columns: {len(df_verified.columns)}, Rows: {len(df_verified):,}")
     
@@ -180,8 +214,8 @@ def save_datasets(df_verified, threshold, output_dir, apify_dir):
     urls = df_verified['linkedin_url'].unique()
     urls_txt = os.path.join(apify_dir, f"linkedin_urls_score{threshold}plus_{timestamp}.txt")
     with open(urls_txt, 'w') as f:
-        for url in urls:
-            f.write(url + '\n')
+        if len(urls):
+            f.write('\n'.join(urls) + '\n')
     print(f"\n✓ URLs for Apify: {urls_txt}")
     print(f"  Unique URLs: {len(urls):,}")
     
@@ -202,15 +236,20 @@ def save_datasets(df_verified, threshold, output_dir, apify_dir):
     print(f"  Profiles: {len(urls):,}")
     print(f"  Max posts per profile: 50")
     
+    # Distributions shared by the metadata and the report, one pass each
+    n_companies = df_verified['company_name'].nunique() if 'company_name' in df_verified.columns else None
+    score_counts = df_verified['match_score'].value_counts()
+    quality_counts = df_verified['quality_flag'].value_counts() if 'quality_flag' in df_verified.columns else None
+    
     # 4. Summary metadata
     metadata = {
         'created_at': timestamp,
         'threshold': threshold,
         'total_directors': len(df_verified),
         'unique_urls': len(urls),
-        'companies': df_verified['company_name'].nunique() if 'company_name' in df_verified.columns else None,
-        'score_distribution': df_verified['match_score'].value_counts().to_dict(),
-        'quality_distribution': df_verified['quality_flag'].value_counts().to_dict() if 'quality_flag' in df_verified.columns else None
+        'companies': n_companies,
+        'score_distribution': score_counts.to_dict(),
+        'quality_distribution': quality_counts.to_dict() if quality_counts is not None else None
     }
     
     metadata_json = os.path.join(output_dir, f"verification_metadata_score{threshold}plus.json")
@@ -228,16 +267,16 @@ def save_datasets(df_verified, threshold, output_dir, apify_dir):
         f.write(f"Verification threshold: Score >= {threshold}\n\n")
         f.write(f"Total verified directors: {len(df_verified):,}\n")
         f.write(f"Unique LinkedIn URLs: {len(urls):,}\n")
-        if 'company_name' in df_verified.columns:
-            f.write(f"Unique companies: {df_verified['company_name'].nunique():,}\n\n")
+        if n_companies is not None:
+            f.write(f"Unique companies: {n_companies:,}\n\n")
         
         f.write("Score Distribution:\n")
-        for score, count in sorted(df_verified['match_score'].value_counts().items(), reverse=True):
+        for score, count in sorted(score_counts.items(), reverse=True):
             f.write(f"  Score {score}: {count:,}\n")
         
-        if 'quality_flag' in df_verified.columns:
+        if quality_counts is not None:
             f.write("\nQuality Flags:\n")
-            for flag, count in df_verified['quality_flag'].value_counts().items():
+            for flag, count in quality_counts.items():
                 f.write(f"  {flag}: {count:,}\n")
         
         f.write("\n" + "=" * 80 + "\n")
@@ -256,7 +295,8 @@ def save_datasets(df_verified, threshold, output_dir, apify_dir):
         'urls_txt': urls_txt,
         'apify_json': apify_json,
         'metadata': metadata_json,
-        'report': report_path
+        'report': report_path,
+        'unique_urls': len(urls)
     }
 
 
@@ -302,8 +342,11 @@ Score Meanings:
     # Load data
     df = load_verified_data(args.input)
     
+    # URL mask is shared by the statistics and the filter
+    has_url = url_mask(df)
+    
     # Show statistics
-    print_statistics(df, args.threshold)
+    print_statistics(df, args.threshold, has_url)
     
     # If stats only, exit here
     if args.stats:
@@ -311,7 +354,7 @@ Score Meanings:
         return
     
     # Filter to verified
-    df_verified = filter_verified(df, args.threshold)
+    df_verified = filter_verified(df, args.threshold, has_url)
     
     if len(df_verified) == 0:
         print(f"\n❌ No directors meet the threshold of {args.threshold}")
@@ -321,13 +364,14 @@ Score Meanings:
     
     # Save outputs
     outputs = save_datasets(df_verified, args.threshold, OUTPUT_DIR, APIFY_DIR)
+    n_urls = outputs['unique_urls']
     
     # Final summary
     print("\n" + "=" * 80)
     print("✅ PREPARATION COMPLETE")
     print("=" * 80)
     print(f"\nVerified directors ready for scraping: {len(df_verified):,}")
-    print(f"Unique LinkedIn URLs: {df_verified['linkedin_url'].nunique():,}")
+    print(f"Unique LinkedIn URLs: {n_urls:,}")
     
     print("\n📋 NEXT STEPS:")
     print("=" * 80)
@@ -336,7 +380,7 @@ Score Meanings:
     print(f"   Actor: apimaestro/linkedin-batch-profile-posts-scraper")
     
     print("\n2. Configure Apify:")
-    print(f"   - Profiles: {df_verified['linkedin_url'].nunique():,}")
+    print(f"   - Profiles: {n_urls:,}")
     print(f"   - Max posts per profile: 50")
     print(f"   - Estimated cost: Check Apify pricing")
     
@@ -9,6 +9,7 @@ Usage:
 """
 
 import pandas as pd
+import numpy as np
 import os
 
 # Configuration - adjust path if needed
@@ -33,11 +34,11 @@ def main():
     
     print(f"\nFound {len(batch_files)} batch files")
     
-    # Load and combine
+    # Load and combine (multithreaded Arrow parser, one pass per batch)
     dfs = []
     for f in batch_files:
         path = os.path.join(BATCH_DIR, f)
-        df = pd.read_csv(path)
+        df = pd.read_csv(path, engine='pyarrow')
         dfs.append(df)
         
         # Check if this batch has original URLs
@@ -57,21 +58,30 @@ def main():
         sys.path.insert(0, os.path.dirname(__file__))
         from linkedin_verification import verify_name_match
     
-    # Add verification columns
-    combined['verified'] = False
-    combined['match_type'] = 'none'
-    
-    verified_count = 0
-    for idx, row in combined.iterrows():
-        if pd.notna(row.get('linkedin_url')) and row.get('search_status') == 'found':
-            result = verify_name_match(
-                row.get('director_name_clean', ''),
-                row.get('linkedin_title', '')
-            )
-            combined.at[idx, 'verified'] = result['verified']
-            combined.at[idx, 'match_type'] = result['match_type']
-            if result['verified']:
-                verified_count += 1
+    # Verification columns, filled by position and assigned in one go
+    verified = np.zeros(len(combined), dtype=bool)
+    match_type = np.full(len(combined), 'none', dtype=object)
+    
+    # Only rows with a found URL are checked
+    found = np.zeros(len(combined), dtype=bool)
+    if 'linkedin_url' in combined.columns and 'search_status' in combined.columns:
+        found = (combined['linkedin_url'].notna() & combined['search_status'].eq('found')).to_numpy()
+    rows = np.flatnonzero(found)
+    
+    def column_values(name):
+        if name in combined.columns:
+            return combined[name].to_numpy(dtype=object)[rows]
+        return [''] * len(rows)
+    
+    for i, name, title in zip(rows, column_values('director_name_clean'),
+                              column_values('linkedin_title')):
+        result = verify_name_match(name, title)
+        verified[i] = result['verified']
+        match_type[i] = result['match_type']
+    
+    combined['verified'] = verified
+    combined['match_type'] = match_type
+    verified_count = int(verified.sum())
     
     # Stats
     total = len(combined)
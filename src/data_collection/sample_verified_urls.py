@@ -13,13 +13,17 @@ Usage:
 """
 
 import pandas as pd
+import numpy as np
 import argparse
 import sys
 import os
 
-# Add project path
-sys.path.insert(0, '/mnt/project')
-from linkedin_verification import verify_name_match
+try:
+    from linkedin_verification import verify_name_match
+except ImportError:
+    # If running from different directory, try adding this script's dir to path
+    sys.path.insert(0, os.path.dirname(__file__))
+    from linkedin_verification import verify_name_match
 
 
 def sample_verified_profiles(csv_path, sample_size=20, company_filter=None):
@@ -46,24 +50,30 @@ def sample_verified_profiles(csv_path, sample_size=20, company_filter=None):
     # Re-verify all URLs to get current strict verification
     print("\nRe-verifying with STRICT mode...")
     
+    # Only rows with a URL are checked; pull just those values out once
+    has_url = np.zeros(len(df), dtype=bool)
+    if 'linkedin_url' in df.columns:
+        has_url = df['linkedin_url'].notna().to_numpy()
+    
+    def column_values(name):
+        if name in df.columns:
+            return df[name].to_numpy(dtype=object)[has_url]
+        return [''] * int(has_url.sum())
+    
     verified_profiles = []
     
-    for idx, row in df.iterrows():
-        if pd.isna(row.get('linkedin_url')):
-            continue
-        
-        result = verify_name_match(
-            row.get(name_col, ''),
-            row.get('linkedin_title', '')
-        )
+    for name, company, title, url in zip(column_values(name_col), column_values(company_col),
+                                         column_values('linkedin_title'),
+                                         column_values('linkedin_url')):
+        result = verify_name_match(name, title)
         
         # STRICT: Only accept if BOTH names match
         if result['matched_first'] and result['matched_last']:
             verified_profiles.append({
-                'director_name': row.get(name_col, ''),
-                'company_name': row.get(company_col, ''),
-                'linkedin_title': row.get('linkedin_title', ''),
-                'linkedin_url': row.get('linkedin_url', ''),
+                'director_name': name,
+                'company_name': company,
+                'linkedin_title': title,
+                'linkedin_url': url,
                 'matched_first': result['matched_first'],
                 'matched_last': result['matched_last'],
             })
@@ -74,7 +84,8 @@ def sample_verified_profiles(csv_path, sample_size=20, company_filter=None):
     
     # Apply company filter if specified
     if company_filter:
-        mask = verified_df['company_name'].str.contains(company_filter, case=False, na=False)
+        mask = verified_df['company_name'].str.contains(company_filter, case=False, na=False,
+                                                       regex=False)
         verified_df = verified_df[mask]
         print(f"Profiles matching '{company_filter}': {len(verified_df)}")
         sample_df = verified_df
@@ -1,14 +1,20 @@
 import pandas as pd
 
 file_path = '/Users/melvinliam/Documents/Uni/RA-NB/Scraping/ai-enthusiasm-research/data/processed/sp500_linkedin_urls/all_sp500_linkedin_urls.csv'
-df = pd.read_csv(file_path)
+# Only the columns printed below are parsed
+df = pd.read_csv(file_path, usecols=['verified', 'linkedin_url', 'director_name_clean',
+                                     'company_name_clean', 'linkedin_title'])
 
 # Check what's in the verified column
 print("Verified column dtype:", df['verified'].dtype)
 print("Unique values:", df['verified'].unique()[:10])
 
-# Filter using string comparison instead
-unverified = df[(df['verified'].astype(str) == 'False') & (df['linkedin_url'].notna())].copy()
+# Filter using string comparison instead (a bool column needs no string copy)
+if df['verified'].dtype == bool:
+    is_false = ~df['verified']
+else:
+    is_false = df['verified'].astype(str) == 'False'
+unverified = df[is_false & (df['linkedin_url'].notna())].copy()
 
 print(f"\nUnverified rows: {len(unverified)}")
 
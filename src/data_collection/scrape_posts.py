@@ -41,9 +41,11 @@ Usage:
     python3 scrape_posts.py --input urls.csv --resume               # Resume
     python3 scrape_posts.py --input urls.csv --run --no-filter      # Include unverified
     python3 scrape_posts.py --input urls.csv --run --max-posts 200  # Override post limit
+    python3 scrape_posts.py --input urls.csv --run --concurrency 4  # 4 Apify runs at once
 
 Prerequisites:
     pip install apify-client pandas python-dotenv
+    pip install orjson   (optional — faster raw JSON / JSONL writes)
     APIFY_API_TOKEN in .env file (searched upward from CWD, or via --env)
 
 Apify actor:
@@ -55,11 +57,14 @@ import os
 import sys
 import json
 import time
+import random
 import argparse
+import threading
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # ---------------------------------------------------------------------------
 # Dependency checks
@@ -76,6 +81,17 @@ except ImportError:
     print("\n  pip install apify-client")
     sys.exit(1)
 
+try:
+    import orjson  # optional C encoder for the large raw-data writes
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # no Parquet input cache without pyarrow
+    pa = pq = None
+
 
 # ===========================================================================
 # Configuration defaults (overridable via CLI)
@@ -84,10 +100,21 @@ except ImportError:
 APIFY_ACTOR = "apimaestro/linkedin-batch-profile-posts-scraper"
 DEFAULT_MAX_POSTS = 10000
 DEFAULT_BATCH_SIZE = 100   # profiles per Apify run
-DELAY_BETWEEN_BATCHES = 10  # seconds
+MAX_BACKOFF = 60            # seconds, cap on the delay after failed batches
+MAX_RATE_LIMIT_RETRIES = 5  # retries of one batch after HTTP 429
+DEFAULT_CONCURRENCY = 1     # Apify runs in flight at once
+DEFAULT_CHUNKSIZE = 100_000  # input CSV rows parsed per chunk
+
+# Large stdio buffer and row chunks for CSV output
+IO_BUFFER_SIZE = 4 * 1024 * 1024
+CSV_CHUNKSIZE = 100_000
 
 URL_COLUMN_CANDIDATES = ["linkedin_url", "profile_url", "url", "LinkedIn URL"]
 
+# Search/verification machinery, not carried through as post metadata
+SKIP_META_COLUMNS = frozenset({"search_query", "linkedin_title", "search_status",
+                               "verified", "match_type"})
+
 
 # ===========================================================================
 # Environment / credentials
@@ -152,10 +179,89 @@ def _detect_column(df, candidates, required=False, label="column"):
     return None
 
 
-def load_input(filepath, filter_verified=True):
+# Spellings of the 'verified' flag as written by find_urls.py / pandas
+_VERIFIED_STRINGS = {"True": True, "False": False, "true": True, "false": False}
+
+
+def _coerce_verified(verified):
+    """Coerce a 'verified' column to bool ("true" in any case/padding → True).
+
+    Bool columns pass through; the common spellings are mapped directly and
+    only the leftovers take the slower strip/lower string path.
+    """
+    if verified.dtype == bool:
+        return verified
+    mapped = verified.map(_VERIFIED_STRINGS)
+    other = mapped.isna()
+    if other.any():
+        mapped[other] = verified[other].astype(str).str.strip().str.lower() == "true"
+    return mapped.astype(bool)
+
+
+def _cache_path(filepath):
+    return filepath.with_suffix(".cache.parquet")
+
+
+def _iter_input_chunks(filepath, chunksize, nrows=None, use_cache=False):
+    """Yield the input CSV as DataFrame chunks, via a Parquet cache if allowed.
+
+    A cache newer than the CSV is read batch by batch instead of re-parsing
+    the CSV.  Otherwise the CSV is parsed and, on full reads, each chunk is
+    also appended to a fresh cache for the next run.  If a later chunk's
+    types don't fit the first chunk's schema, caching is skipped this time.
+    """
+    cache = _cache_path(filepath)
+    use_cache = use_cache and pq is not None and nrows is None
+
+    if use_cache and cache.exists() and cache.stat().st_mtime >= filepath.stat().st_mtime:
+        print(f"  Cache:  {cache}")
+        parquet = pq.ParquetFile(cache)
+        if not parquet.metadata.num_rows:
+            yield parquet.schema_arrow.empty_table().to_pandas()
+            return
+        offset = 0
+        for batch in parquet.iter_batches(batch_size=chunksize):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+        return
+
+    tmp = cache.with_name(cache.name + ".tmp")
+    writer = None
+    for chunk in pd.read_csv(filepath, chunksize=chunksize, nrows=nrows):
+        if use_cache:
+            try:
+                if writer is None:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    writer = pq.ParquetWriter(tmp, table.schema, compression="zstd")
+                else:
+                    table = pa.Table.from_pandas(chunk, schema=writer.schema,
+                                                 preserve_index=False)
+                writer.write_table(table)
+            except pa.ArrowException:
+                if writer is not None:
+                    writer.close()
+                tmp.unlink(missing_ok=True)
+                use_cache = False
+        yield chunk
+
+    if use_cache and writer is not None:
+        writer.close()
+        tmp.replace(cache)
+
+
+def load_input(filepath, filter_verified=True, chunksize=DEFAULT_CHUNKSIZE,
+               nrows=None, use_cache=False):
     """
     Load input CSV and apply verified filtering.
 
+    The CSV is parsed *chunksize* rows at a time and each chunk is filtered
+    before the next is read, so peak memory tracks the scrapable rows rather
+    than the whole file.  *nrows* limits the read to the first N rows.
+    With *use_cache*, full reads go through a Parquet copy of the CSV kept
+    next to it (see _iter_input_chunks).
+
     Returns:
         (df, url_col)  where df has only scrapable rows.
     """
@@ -165,27 +271,41 @@ def load_input(filepath, filter_verified=True):
         sys.exit(1)
 
     print(f"  Input:  {filepath}")
-    df = pd.read_csv(filepath)
-    print(f"  Rows:   {len(df):,}   Columns: {len(df.columns)}")
-
-    url_col = _detect_column(df, URL_COLUMN_CANDIDATES,
-                             required=True, label="LinkedIn URL")
+    url_col = None
+    filter_on_verified = False
+    n_rows = 0
+    n_verified = 0
+    parts = []
+    for chunk in _iter_input_chunks(filepath, chunksize, nrows, use_cache):
+        if url_col is None:
+            url_col = _detect_column(chunk, URL_COLUMN_CANDIDATES,
+                                     required=True, label="LinkedIn URL")
+            filter_on_verified = filter_verified and "verified" in chunk.columns
+            n_columns = len(chunk.columns)
+        n_rows += len(chunk)
+
+        # --- Verified filtering ---
+        if filter_on_verified:
+            # Coerce to bool safely (handles string "True"/"False" from CSV)
+            chunk["verified"] = _coerce_verified(chunk["verified"])
+            chunk = chunk[chunk["verified"]]
+            n_verified += len(chunk)
+
+        # Drop rows without a URL
+        parts.append(chunk[chunk[url_col].notna()])
+
+    df = pd.concat(parts)
+    print(f"  Rows:   {n_rows:,}   Columns: {n_columns}")
     print(f"  URL column: {url_col}")
 
-    # --- Verified filtering ---
-    if filter_verified and "verified" in df.columns:
-        before = len(df)
-        # Coerce to bool safely (handles string "True"/"False" from CSV)
-        df["verified"] = df["verified"].astype(str).str.strip().str.lower() == "true"
-        df = df[df["verified"]].copy()
-        dropped = before - len(df)
-        print(f"  Filtered to verified=True: {len(df):,} (dropped {dropped:,} unverified)")
+    before = n_rows
+    if filter_on_verified:
+        before = n_verified
+        dropped = n_rows - n_verified
+        print(f"  Filtered to verified=True: {n_verified:,} (dropped {dropped:,} unverified)")
     elif filter_verified:
         print(f"  No 'verified' column — scraping all rows with URLs")
 
-    # Drop rows without a URL
-    before = len(df)
-    df = df[df[url_col].notna()].copy()
     if len(df) < before:
         print(f"  Dropped {before - len(df):,} rows with missing URL")
 
@@ -194,13 +314,17 @@ def load_input(filepath, filter_verified=True):
 
 def _get_unique_urls(df, url_col):
     """Deduplicate URLs preserving order."""
-    raw = df[url_col].tolist()
-    unique = list(dict.fromkeys(raw))
-    if len(unique) < len(raw):
-        print(f"  Deduplicated: {len(raw):,} → {len(unique):,} unique URLs")
+    unique = df[url_col].drop_duplicates().tolist()
+    if len(unique) < len(df):
+        print(f"  Deduplicated: {len(df):,} → {len(unique):,} unique URLs")
     return unique
 
 
+def _metadata_columns(df, url_col):
+    """Input columns carried through to the outputs as metadata."""
+    return [c for c in df.columns if c != url_col and c not in SKIP_META_COLUMNS]
+
+
 def _build_url_metadata(df, url_col):
     """Build lookup:  url → list[dict] of metadata rows.
 
@@ -208,15 +332,10 @@ def _build_url_metadata(df, url_col):
     search/verification machinery.  One URL can map to multiple rows
     (e.g. director on multiple boards).
     """
-    # Columns to skip (search machinery, not useful downstream)
-    skip = {url_col, "search_query", "linkedin_title", "search_status",
-            "verified", "match_type"}
-    keep = [c for c in df.columns if c not in skip]
-
+    # Build all metadata dicts in one pass, then group them by URL
+    records = df[_metadata_columns(df, url_col)].to_dict("records")
     lookup = {}
-    for _, row in df.iterrows():
-        url = row[url_col]
-        meta = {c: row[c] for c in keep}
+    for url, meta in zip(df[url_col].tolist(), records):
         lookup.setdefault(url, []).append(meta)
     return lookup
 
@@ -242,9 +361,7 @@ def print_stats(df, url_col, max_posts, batch_size):
     print(f"  Batches:                   {n_batches}")
 
     # Metadata columns detected
-    meta_cols = [c for c in df.columns
-                 if c not in {url_col, "search_query", "linkedin_title",
-                              "search_status", "verified", "match_type"}]
+    meta_cols = _metadata_columns(df, url_col)
     if meta_cols:
         print(f"  Metadata columns:          {', '.join(meta_cols[:8])}")
         if len(meta_cols) > 8:
@@ -266,8 +383,15 @@ def print_stats(df, url_col, max_posts, batch_size):
 # Apify integration
 # ===========================================================================
 
+RATE_LIMITED = "RATE_LIMITED"  # _call_apify result when Apify answers HTTP 429
+ALREADY_SCRAPED = "ALREADY_SCRAPED"  # batch whose profiles are all in the temp file
+
+
 def _call_apify(client, profile_urls, max_posts):
-    """Run the Apify actor for one batch. Returns list of items or None."""
+    """Run the Apify actor for one batch.
+
+    Returns list of items, RATE_LIMITED on HTTP 429, or None on failure.
+    """
     run_input = {
         "usernames": profile_urls,
         "total_posts": max_posts,  # enables automatic pagination (max 10000)
@@ -288,35 +412,114 @@ def _call_apify(client, profile_urls, max_posts):
         return items
 
     except Exception as e:
+        if getattr(e, "status_code", None) == 429:
+            print(f"      ✗ Apify rate limit: {e}")
+            return RATE_LIMITED
         print(f"      ✗ Apify error: {e}")
         return None
 
 
+def _backoff_delay(failures):
+    """Jittered exponential backoff: ~2, 4, 8 … seconds, capped at MAX_BACKOFF."""
+    return min(MAX_BACKOFF, 2 ** failures + random.random())
+
+
+def _batch_pacer():
+    """Return (wait, report) shared by the batch threads.
+
+    Successful batches add no delay.  report(False) extends a pause before the
+    next batch start by an exponential, jittered backoff that grows with the
+    failure streak; report(True) ends the streak.
+    """
+    lock = threading.Lock()
+    state = {"failures": 0, "resume_at": 0.0}
+
+    def wait():
+        with lock:
+            delay = state["resume_at"] - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def report(ok):
+        with lock:
+            if ok:
+                state["failures"] = 0
+            else:
+                state["failures"] += 1
+                state["resume_at"] = time.monotonic() + _backoff_delay(state["failures"])
+
+    return wait, report
+
+
 def _scrape_batches(client, urls, max_posts, batch_size,
                     temp_file, output_dir, start_from_global,
-                    items_so_far=0):
+                    items_so_far=0, concurrency=DEFAULT_CONCURRENCY, skip=None):
     """Scrape *urls* in mini-batches, appending results to a JSONL temp file.
 
+    Up to *concurrency* Apify runs are in flight at once, but results are
+    handled in batch order so the checkpoint always covers a prefix of *urls*.
+    Profiles whose normalised URL is in *skip* are not submitted again.
+
     Returns (total_items, completed).  No results are kept in RAM.
     """
     total = len(urls)
     n_batches = (total + batch_size - 1) // batch_size
-    consecutive_failures = 0
-    MAX_CONSECUTIVE_FAILURES = 3
-    items_count = items_so_far
-    seen_over_1000 = False  # once True, the 1000-cap check is disabled
 
     print(f"\n{'=' * 70}")
     print(f"SCRAPING {total:,} PROFILES IN {n_batches} BATCHES")
+    if concurrency > 1:
+        print(f"  ({concurrency} batches in flight)")
     print("=" * 70)
 
-    for i in range(0, total, batch_size):
+    wait_turn, report = _batch_pacer()
+    stopped = threading.Event()
+
+    def run_batch(batch_urls):
+        if skip:
+            batch_urls = [u for u in batch_urls if _normalise_url(u) not in skip]
+            if not batch_urls:
+                return ALREADY_SCRAPED
+        for _ in range(MAX_RATE_LIMIT_RETRIES + 1):
+            wait_turn()
+            if stopped.is_set():
+                return None
+            items = _call_apify(client, batch_urls, max_posts)
+            report(items is not None and items != RATE_LIMITED)
+            if items != RATE_LIMITED:
+                return items
+            print(f"      ⏳ Rate limited — retrying after backoff")
+        return None
+
+    pool = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    futures = [pool.submit(run_batch, urls[i : i + batch_size])
+               for i in range(0, total, batch_size)]
+    try:
+        return _collect_batches(futures, urls, batch_size, n_batches,
+                                temp_file, output_dir, start_from_global,
+                                items_so_far)
+    finally:
+        # On abort, drop batches that have not called Apify yet
+        stopped.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _collect_batches(futures, urls, batch_size, n_batches,
+                     temp_file, output_dir, start_from_global, items_count):
+    """Handle finished batches in order: save items, checkpoint, abort checks."""
+    total = len(urls)
+    consecutive_failures = 0
+    MAX_CONSECUTIVE_FAILURES = 3
+    seen_over_1000 = False  # once True, the 1000-cap check is disabled
+
+    for i, future in zip(range(0, total, batch_size), futures):
         batch_num = i // batch_size + 1
         batch_urls = urls[i : i + batch_size]
         print(f"\n  Batch {batch_num}/{n_batches}  ({len(batch_urls)} profiles)")
 
-        items = _call_apify(client, batch_urls, max_posts)
-        if items:
+        items = future.result()
+        if items == ALREADY_SCRAPED:
+            print(f"      ↷ Already in temp results — skipped")
+        elif items:
             # --- 1000-post cap detection ---
             # Count posts per profile in this batch
             profile_counts = Counter()
@@ -335,9 +538,7 @@ def _scrape_batches(client, urls, max_posts, batch_size,
                 capped_profiles = [p for p, c in profile_counts.items() if c == 1000]
                 if capped_profiles:
                     # Save what we have first
-                    with open(temp_file, "a", encoding="utf-8") as f:
-                        for item in items:
-                            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                    _append_jsonl(temp_file, items)
                     items_count += len(items)
 
                     profiles_done = start_from_global + i + len(batch_urls)
@@ -357,9 +558,7 @@ def _scrape_batches(client, urls, max_posts, batch_size,
             # --- end cap detection ---
 
             # Append to JSONL file immediately — no RAM accumulation
-            with open(temp_file, "a", encoding="utf-8") as f:
-                for item in items:
-                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            _append_jsonl(temp_file, items)
             items_count += len(items)
             consecutive_failures = 0
             print(f"      Running total: {items_count:,} items")
@@ -376,10 +575,6 @@ def _scrape_batches(client, urls, max_posts, batch_size,
         profiles_done = start_from_global + i + len(batch_urls)
         _save_checkpoint(profiles_done, items_count, temp_file, output_dir)
 
-        if i + batch_size < total:
-            print(f"      Waiting {DELAY_BETWEEN_BATCHES}s …")
-            time.sleep(DELAY_BETWEEN_BATCHES)
-
     return items_count, True  # completed
 
 
@@ -412,22 +607,88 @@ def _normalise_url(url):
     return url.split("?")[0].rstrip("/")
 
 
+def _normalise_url_series(urls):
+    """Vectorised _normalise_url over a Series of URLs (missing → "")."""
+    return urls.fillna("").str.split("?", n=1).str[0].str.rstrip("/")
+
+
+# Top-level item keys _parse_results reads; missing ones parse as empty fields
+_EXPECTED_ITEM_KEYS = ("profile_input", "text", "url", "post_type",
+                       "posted_at", "author", "stats")
+
+
+def _missing_item_keys(raw_data):
+    """Expected item keys that no item in *raw_data* has (schema drift)."""
+    missing = set(_EXPECTED_ITEM_KEYS)
+    for item in raw_data:
+        missing -= item.keys()
+        if not missing:
+            break
+    return [k for k in _EXPECTED_ITEM_KEYS if k in missing]
+
+
+# Column order of the per-post fields in the posts CSV
+_POST_COLUMNS = [
+    "profile_url", "post_text", "post_url", "post_type", "post_date",
+    "post_timestamp", "author_name", "author_headline", "reactions_total",
+    "likes", "comments", "reposts", "celebrates", "supports", "loves",
+    "insights", "funnys", "media_type", "article_url", "article_title",
+    "reshared_text", "reshared_url", "reshared_author",
+]
+
+
+def _join_metadata(left, keys, norm_meta):
+    """Left-join input metadata onto *left* by normalised URL.
+
+    *keys* holds each row's normalised URL.  A row is repeated once per
+    metadata row of its profile (one per company/board membership); rows
+    without metadata are kept once with empty fields.  Columns of *left* win
+    over metadata columns of the same name, and columns come out in the order
+    that building each row as {**meta, **row} would give.
+    """
+    wanted = set(keys)
+    meta_urls = []
+    meta_records = []
+    for url, metas in norm_meta.items():
+        if url in wanted:
+            meta_urls.extend([url] * len(metas))
+            meta_records.extend(metas)
+    meta_df = pd.DataFrame(meta_records)
+    if not len(meta_df.columns):
+        return left
+
+    left_cols = list(left.columns)
+    meta_cols = list(meta_df.columns)
+    meta_df = meta_df.drop(columns=[c for c in meta_cols if c in left_cols])
+    meta_df["__url_key"] = meta_urls
+    joined = left.assign(__url_key=keys).merge(meta_df, on="__url_key", how="left")
+
+    # Metadata columns lead unless the first row had no metadata
+    if keys[0] in norm_meta:
+        columns = meta_cols + [c for c in left_cols if c not in meta_cols]
+    else:
+        columns = left_cols + [c for c in meta_cols if c not in left_cols]
+    return joined[columns]
+
+
 def _parse_results(raw_data, url_metadata):
     """Parse flat Apify items into posts and profiles.
 
-    Returns (posts_list, profiles_list).
+    Returns (posts_df, profiles_list, norm_meta), where norm_meta is the
+    metadata lookup keyed by normalised URL.
     """
-    posts_list = []
+    post_rows = []
     profiles_seen = {}  # normalised_url → profile info
 
     # Pre-normalise the metadata lookup keys
-    norm_meta = {}
-    for url, metas in url_metadata.items():
-        norm_meta[_normalise_url(url)] = metas
+    norm_keys = _normalise_url_series(pd.Series(list(url_metadata), dtype=object))
+    norm_meta = dict(zip(norm_keys, url_metadata.values()))
 
-    for item in raw_data:
-        # --- Identify which submitted profile this post belongs to ---
-        submitted_url = _normalise_url(item.get("profile_input", ""))
+    # Identify which submitted profile each post belongs to, all at once
+    submitted = _normalise_url_series(pd.Series(
+        [item.get("profile_input", "") for item in raw_data], dtype=object))
+
+    for item, submitted_url in zip(raw_data, submitted):
 
         # --- Extract author info (nested under 'author') ---
         author = item.get("author") or {}
@@ -450,44 +711,56 @@ def _parse_results(raw_data, url_metadata):
         stats = item.get("stats") or {}
         media = item.get("media") or {}
         article = item.get("article") or {}
-        reshared = item.get("reshared_post") or {}
-        reshared_author = reshared.get("author") or {}
-
-        post_core = {
-            "profile_url": submitted_url,
-            "post_text": item.get("text", ""),
-            "post_url": item.get("url", ""),
-            "post_type": item.get("post_type", ""),
-            "post_date": posted_at.get("date", ""),
-            "post_timestamp": posted_at.get("timestamp", ""),
-            "author_name": author_name,
-            "author_headline": author_headline,
-            "reactions_total": stats.get("total_reactions", 0),
-            "likes": stats.get("like", 0),
-            "comments": stats.get("comments", 0),
-            "reposts": stats.get("reposts", 0),
-            "celebrates": stats.get("celebrate", 0),
-            "supports": stats.get("support", 0),
-            "loves": stats.get("love", 0),
-            "insights": stats.get("insight", 0),
-            "funnys": stats.get("funny", 0),
-            "media_type": media.get("type", ""),
-            "article_url": article.get("url", ""),
-            "article_title": article.get("title", ""),
+        reshared = item.get("reshared_post")
+        if reshared:
+            reshared_author = reshared.get("author") or {}
+            reshared_fields = (
+                reshared.get("text", ""),
+                reshared.get("url", ""),
+                f"{reshared_author.get('first_name', '')} {reshared_author.get('last_name', '')}".strip(),
+            )
+        else:
+            reshared_fields = ("", "", "")
+
+        # One tuple per post, in _POST_COLUMNS order
+        post_rows.append((
+            submitted_url,
+            item.get("text", ""),
+            item.get("url", ""),
+            item.get("post_type", ""),
+            posted_at.get("date", ""),
+            posted_at.get("timestamp", ""),
+            author_name,
+            author_headline,
+            stats.get("total_reactions", 0),
+            stats.get("like", 0),
+            stats.get("comments", 0),
+            stats.get("reposts", 0),
+            stats.get("celebrate", 0),
+            stats.get("support", 0),
+            stats.get("love", 0),
+            stats.get("insight", 0),
+            stats.get("funny", 0),
+            media.get("type", ""),
+            article.get("url", ""),
+            article.get("title", ""),
             # Reshared post (for post_type="quote" — director endorsed this)
-            "reshared_text": reshared.get("text", ""),
-            "reshared_url": reshared.get("url", ""),
-            "reshared_author": f"{reshared_author.get('first_name', '')} {reshared_author.get('last_name', '')}".strip(),
-        }
-
-        # --- Join metadata (one row per company/board membership) ---
-        meta_rows = norm_meta.get(submitted_url, [{}])
-        for meta in meta_rows:
-            row = {**meta, **post_core}
-            posts_list.append(row)
+            *reshared_fields,
+        ))
 
+    posts_df = pd.DataFrame(post_rows, columns=_POST_COLUMNS)
     profiles_list = list(profiles_seen.values())
-    return posts_list, profiles_list
+
+    # --- Join metadata (one row per company/board membership) ---
+    posts_df = _join_metadata(posts_df, posts_df["profile_url"].tolist(), norm_meta)
+
+    return posts_df, profiles_list, norm_meta
+
+
+def _write_csv(df, path):
+    """Write *df* as UTF-8 CSV through a large buffer, in row chunks."""
+    with open(path, "w", buffering=IO_BUFFER_SIZE, encoding="utf-8", newline="") as f:
+        df.to_csv(f, index=False, chunksize=CSV_CHUNKSIZE)
 
 
 def _save_results(raw_data, output_dir, df, url_col, submitted_urls=None):
@@ -504,8 +777,12 @@ def _save_results(raw_data, output_dir, df, url_col, submitted_urls=None):
 
     # 1. Raw JSON (always save first — safety net)
     raw_path = output_dir / f"posts_raw_{ts}.json"
-    with open(raw_path, "w", encoding="utf-8") as f:
-        json.dump(raw_data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(raw_path, "wb") as f:
+            f.write(orjson.dumps(raw_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(raw_path, "w", encoding="utf-8") as f:
+            json.dump(raw_data, f, indent=2, ensure_ascii=False)
     print(f"\n  ✓ Raw JSON:     {raw_path}")
 
     # Debug: structure check
@@ -516,16 +793,18 @@ def _save_results(raw_data, output_dir, df, url_col, submitted_urls=None):
             print(f"    profile_input ✓ (join key present)")
         else:
             print(f"    ⚠ No 'profile_input' — metadata join may fail")
+        missing = _missing_item_keys(raw_data)
+        if missing:
+            print(f"    ⚠ No item has {', '.join(missing)} — actor output schema may have changed")
 
     # 2. Parse
-    posts_list, profiles_list = _parse_results(raw_data, url_metadata)
+    posts_df, profiles_list, norm_meta = _parse_results(raw_data, url_metadata)
 
     # 3. Posts CSV
     posts_path = None
-    if posts_list:
-        posts_df = pd.DataFrame(posts_list)
+    if len(posts_df):
         posts_path = output_dir / f"posts_{ts}.csv"
-        posts_df.to_csv(posts_path, index=False, encoding="utf-8")
+        _write_csv(posts_df, posts_path)
         print(f"  ✓ Posts CSV:    {posts_path}  ({len(posts_df):,} rows)")
     else:
         print("  ⚠ No posts parsed — inspect raw JSON for unexpected structure")
@@ -535,7 +814,7 @@ def _save_results(raw_data, output_dir, df, url_col, submitted_urls=None):
     if profiles_list:
         profiles_df = pd.DataFrame(profiles_list)
         profiles_path = output_dir / f"profiles_{ts}.csv"
-        profiles_df.to_csv(profiles_path, index=False, encoding="utf-8")
+        _write_csv(profiles_df, profiles_path)
         print(f"  ✓ Profiles CSV: {profiles_path}  ({len(profiles_df):,} rows)")
 
     # 5. No-posts profiles CSV
@@ -543,21 +822,18 @@ def _save_results(raw_data, output_dir, df, url_col, submitted_urls=None):
     #    Useful for distinguishing "never posts" from "scrape failed".
     no_posts_path = None
     if submitted_urls:
-        urls_with_posts = {_normalise_url(p["profile_url"]) for p in profiles_list}
-        no_post_urls = [u for u in submitted_urls
-                        if _normalise_url(u) not in urls_with_posts]
+        # profile_url values are already normalised
+        urls_with_posts = {p["profile_url"] for p in profiles_list}
+        submitted = pd.Series(submitted_urls, dtype=object)
+        submitted_norm = _normalise_url_series(submitted)
+        no_posts = ~submitted_norm.isin(urls_with_posts)
+        no_post_urls = submitted[no_posts].tolist()
         if no_post_urls:
-            # Look up metadata for these profiles
-            norm_meta = {_normalise_url(u): m
-                         for u, m in url_metadata.items()}
-            no_posts_rows = []
-            for url in no_post_urls:
-                metas = norm_meta.get(_normalise_url(url), [{}])
-                for meta in metas:
-                    no_posts_rows.append({**meta, "profile_url": url})
-            no_posts_df = pd.DataFrame(no_posts_rows)
+            no_posts_df = _join_metadata(
+                pd.DataFrame({"profile_url": no_post_urls}),
+                submitted_norm[no_posts].tolist(), norm_meta)
             no_posts_path = output_dir / f"no_posts_profiles_{ts}.csv"
-            no_posts_df.to_csv(no_posts_path, index=False, encoding="utf-8")
+            _write_csv(no_posts_df, no_posts_path)
             print(f"  ✓ No-posts CSV: {no_posts_path}  ({len(no_post_urls):,} profiles)")
 
     return {
@@ -565,7 +841,7 @@ def _save_results(raw_data, output_dir, df, url_col, submitted_urls=None):
         "posts_path": str(posts_path) if posts_path else None,
         "profiles_path": str(profiles_path) if profiles_path else None,
         "no_posts_path": str(no_posts_path) if no_posts_path else None,
-        "posts_count": len(posts_list),
+        "posts_count": len(posts_df),
         "profiles_count": len(profiles_list),
         "no_posts_count": len(no_post_urls) if submitted_urls else 0,
         "timestamp": ts,
@@ -584,19 +860,72 @@ def _temp_results_path(output_dir):
     return Path(output_dir) / "temp_results.jsonl"
 
 
+def _append_jsonl(temp_file, items):
+    """Append *items* to the JSONL temp file in one write, synced to disk.
+
+    The checkpoint written after this counts these items, so they must be
+    durable first.
+    """
+    if orjson is not None:
+        data = b"".join(orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+                        for item in items)
+    else:
+        data = "".join(json.dumps(item, ensure_ascii=False) + "\n"
+                       for item in items).encode("utf-8")
+    with open(temp_file, "ab") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _read_jsonl(temp_file):
+    """Yield items from the JSONL temp file, skipping blank lines."""
+    with open(temp_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _truncate_jsonl(temp_file, n_items):
+    """Cut the JSONL temp file back to its first *n_items* items."""
+    with open(temp_file, "r+b") as f:
+        kept = 0
+        while kept < n_items:
+            line = f.readline()
+            if not line:
+                break
+            if line.strip():
+                kept += 1
+        f.truncate(f.tell())
+
+
+def _scraped_profiles(temp_file):
+    """Normalised ``profile_input`` of every item in the JSONL temp file."""
+    return {_normalise_url(item.get("profile_input", ""))
+            for item in _read_jsonl(temp_file)} - {""}
+
+
+def _write_json_atomic(path, data):
+    """Write *data* as JSON via a temp file + rename, so a crash never
+    leaves a half-written checkpoint behind."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    tmp.replace(path)
+
+
 def _save_checkpoint(profiles_done, items_count, temp_file, output_dir):
     """Persist progress metadata to disk.  Results are already on disk (JSONL)."""
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    cp_file = _checkpoint_path(output_dir)
-    with open(cp_file, "w") as f:
-        json.dump({
-            "profiles_processed": profiles_done,
-            "items_count": items_count,
-            "results_file": str(temp_file),
-            "timestamp": datetime.now().isoformat(),
-        }, f, indent=2)
+    _write_json_atomic(_checkpoint_path(output_dir), {
+        "profiles_processed": profiles_done,
+        "items_count": items_count,
+        "results_file": str(temp_file),
+        "timestamp": datetime.now().isoformat(),
+    })
     print(f"      💾 Checkpoint: {profiles_done} profiles done, {items_count:,} items")
 
 
@@ -632,7 +961,8 @@ def _clear_checkpoint(output_dir):
 # ===========================================================================
 
 def run_scraping(client, df, url_col, output_dir, max_posts, batch_size,
-                 resume=True, prototype_limit=None):
+                 resume=True, prototype_limit=None,
+                 concurrency=DEFAULT_CONCURRENCY):
     """Main entry point for scraping."""
     output_dir = Path(output_dir)
 
@@ -650,6 +980,7 @@ def run_scraping(client, df, url_col, output_dir, max_posts, batch_size,
     # Resume handling
     start_from = 0
     items_so_far = 0
+    skip = None
     if resume:
         cp = _load_checkpoint(output_dir)
         if cp:
@@ -661,6 +992,13 @@ def run_scraping(client, df, url_col, output_dir, max_posts, batch_size,
         print("\n  ✓ All profiles already scraped!")
         return
 
+    if start_from:
+        # Drop a batch appended after the last checkpoint (it is re-scraped),
+        # then never resubmit a profile that already has results on disk,
+        # e.g. when the input order changed between runs
+        _truncate_jsonl(temp_file, items_so_far)
+        skip = _scraped_profiles(temp_file)
+
     # Ensure temp file exists (don't truncate if resuming)
     if not resume or not temp_file.exists():
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -671,7 +1009,7 @@ def run_scraping(client, df, url_col, output_dir, max_posts, batch_size,
 
     total_items, completed = _scrape_batches(
         client, remaining, max_posts, batch_size,
-        temp_file, output_dir, start_from, items_so_far)
+        temp_file, output_dir, start_from, items_so_far, concurrency, skip)
 
     # Summary
     print(f"\n{'=' * 70}")
@@ -691,12 +1029,7 @@ def run_scraping(client, df, url_col, output_dir, max_posts, batch_size,
         print("=" * 70)
 
         # Load JSONL into memory (safe for small data)
-        raw_data = []
-        with open(temp_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    raw_data.append(json.loads(line))
+        raw_data = list(_read_jsonl(temp_file))
 
         info = _save_results(raw_data, output_dir, df, url_col,
                              submitted_urls=urls)
@@ -725,6 +1058,25 @@ def run_scraping(client, df, url_col, output_dir, max_posts, batch_size,
             print(f"      {_checkpoint_path(output_dir)}")
 
 
+def dry_run_parse(df, url_col, output_dir):
+    """Parse the temp JSONL and report counts, without scraping or writing."""
+    temp_file = _temp_results_path(output_dir)
+    if not temp_file.exists():
+        print(f"\n  ✗ No temp results to parse: {temp_file}")
+        return
+
+    raw_data = list(_read_jsonl(temp_file))
+    print(f"\n  Items in {temp_file}: {len(raw_data):,}")
+    missing = _missing_item_keys(raw_data)
+    if missing:
+        print(f"  ⚠ No item has {', '.join(missing)} — actor output schema may have changed")
+
+    posts_df, profiles_list, _ = _parse_results(
+        raw_data, _build_url_metadata(df, url_col))
+    print(f"  Posts parsed:     {len(posts_df):,}")
+    print(f"  Profiles parsed:  {len(profiles_list):,}")
+
+
 # ===========================================================================
 # SLURM job helper
 # ===========================================================================
@@ -759,6 +1111,7 @@ python3 {script_path} \\
     --output {output_dir} \\
     --max-posts {args.max_posts} \\
     --batch-size {args.batch_size} \\
+    --concurrency {args.concurrency} \\
     --run --yes
 
 echo "Done: $(date)"
@@ -798,6 +1151,9 @@ Examples:
 
   # Generate SLURM job script
   python3 scrape_posts.py --input all_linkedin_urls.csv --slurm
+
+  # Check that scraped results still parse (e.g. after an actor update)
+  python3 scrape_posts.py --input all_linkedin_urls.csv --dry-run-parse
         """,
     )
 
@@ -820,18 +1176,28 @@ Examples:
                         help="Test with N profiles")
     action.add_argument("--slurm", action="store_true",
                         help="Generate a SLURM job script for Sherlock")
+    action.add_argument("--dry-run-parse", action="store_true",
+                        help="Parse the temp results in the output directory — no API calls, no files written")
 
     # Options
     parser.add_argument("--max-posts", type=int, default=DEFAULT_MAX_POSTS,
                         help=f"Max posts per profile (default: {DEFAULT_MAX_POSTS})")
     parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
                         help=f"Profiles per Apify call (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Apify batches run in parallel (default: {DEFAULT_CONCURRENCY})")
     parser.add_argument("--no-filter", action="store_true",
                         help="Scrape ALL rows with URLs (don't filter on verified)")
     parser.add_argument("--yes", "-y", action="store_true",
                         help="Skip confirmation prompts (for SLURM / automation)")
     parser.add_argument("--no-resume", action="store_true",
                         help="Ignore existing checkpoint, start fresh")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"Input CSV rows parsed per chunk (default: {DEFAULT_CHUNKSIZE:,})")
+    parser.add_argument("--nrows", type=int, default=None,
+                        help="Read only the first N input rows (quick --stats / --prototype previews)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't read or write the Parquet copy of the input CSV")
 
     args = parser.parse_args()
 
@@ -848,7 +1214,9 @@ Examples:
 
     # --- Load input ---
     filter_verified = not args.no_filter
-    df, url_col = load_input(str(input_path), filter_verified=filter_verified)
+    df, url_col = load_input(str(input_path), filter_verified=filter_verified,
+                             chunksize=args.chunksize, nrows=args.nrows,
+                             use_cache=not args.no_cache)
 
     # --- SLURM script generation ---
     if args.slurm:
@@ -856,6 +1224,11 @@ Examples:
         generate_slurm_script(args, output_dir)
         return
 
+    # --- Parse check of existing results ---
+    if args.dry_run_parse:
+        dry_run_parse(df, url_col, output_dir)
+        return
+
     # --- Stats only ---
     if args.stats or not (args.run or args.resume or args.prototype):
         print_stats(df, url_col, args.max_posts, args.batch_size)
@@ -880,7 +1253,8 @@ Examples:
                 return
         run_scraping(client, df, url_col, output_dir,
                      args.max_posts, args.batch_size,
-                     resume=False, prototype_limit=args.prototype)
+                     resume=False, prototype_limit=args.prototype,
+                     concurrency=args.concurrency)
         return
 
     # --- Run / Resume ---
@@ -895,7 +1269,8 @@ Examples:
 
     resume = args.resume or (args.run and not args.no_resume)
     run_scraping(client, df, url_col, output_dir,
-                 args.max_posts, args.batch_size, resume=resume)
+                 args.max_posts, args.batch_size, resume=resume,
+                 concurrency=args.concurrency)
 
 
 if __name__ == "__main__":
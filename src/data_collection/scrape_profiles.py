@@ -26,6 +26,7 @@ Output files (saved to --output directory):
     failed_profiles_YYYYMMDD_HHMMSS.csv  - profiles that could not be scraped
     profiles_raw_YYYYMMDD_HHMMSS.json    - raw Apify response
     .scrape_profiles_checkpoint.json     - resumable state (auto-cleaned)
+    temp_profiles_results.jsonl          - incremental raw data (auto-cleaned)
 
 Usage:
     python3 scrape_profiles.py --input urls.csv --stats           # Preview
@@ -48,6 +49,7 @@ import os
 import sys
 import json
 import time
+import random
 import argparse
 import pandas as pd
 from pathlib import Path
@@ -75,7 +77,7 @@ except ImportError:
 
 APIFY_ACTOR = "apimaestro/linkedin-profile-batch-scraper-no-cookies-required"
 DEFAULT_BATCH_SIZE = 100   # profiles per Apify run (actor max is 1000)
-DELAY_BETWEEN_BATCHES = 10  # seconds
+MAX_BACKOFF = 60            # seconds, cap on the delay after failed batches
 
 URL_COLUMN_CANDIDATES = ["linkedin_url", "profile_url", "url", "LinkedIn URL"]
 
@@ -180,10 +182,9 @@ def load_input(filepath, filter_verified=True):
 
 def _get_unique_urls(df, url_col):
     """Deduplicate URLs preserving order."""
-    raw = df[url_col].tolist()
-    unique = list(dict.fromkeys(raw))
-    if len(unique) < len(raw):
-        print(f"  Deduplicated: {len(raw):,} → {len(unique):,} unique URLs")
+    unique = df[url_col].drop_duplicates().tolist()
+    if len(unique) < len(df):
+        print(f"  Deduplicated: {len(df):,} → {len(unique):,} unique URLs")
     return unique
 
 
@@ -246,11 +247,22 @@ def _call_apify(client, profile_urls, batch_num=0, n_batches=0):
         return None
 
 
+def _backoff_delay(failures):
+    """Jittered exponential backoff: ~2, 4, 8 … seconds, capped at MAX_BACKOFF."""
+    return min(MAX_BACKOFF, 2 ** failures + random.random())
+
+
 def _scrape_batches(client, urls, batch_size, checkpoint_cb=None):
-    """Scrape *urls* in mini-batches with checkpointing."""
-    all_results = []
+    """Scrape *urls* in mini-batches with checkpointing.
+
+    After each batch, *checkpoint_cb(batch_items, done)* receives only that
+    batch's items, so checkpoints can be appended rather than rewritten.
+    Items are not kept in memory; returns the number scraped this session.
+    """
+    n_items = 0
     total = len(urls)
     n_batches = (total + batch_size - 1) // batch_size
+    consecutive_failures = 0
 
     print(f"\n{'=' * 70}")
     print(f"SCRAPING {total:,} PROFILES IN {n_batches} BATCHES")
@@ -263,19 +275,23 @@ def _scrape_batches(client, urls, batch_size, checkpoint_cb=None):
 
         items = _call_apify(client, batch_urls, batch_num, n_batches)
         if items:
-            all_results.extend(items)
-            print(f"      Running total: {len(all_results):,} items")
+            n_items += len(items)
+            consecutive_failures = 0
+            print(f"      Running total: {n_items:,} items")
         else:
+            consecutive_failures += 1
             print(f"      ⚠  Batch failed — continuing")
 
         if checkpoint_cb:
-            checkpoint_cb(all_results, i + len(batch_urls))
+            checkpoint_cb(items or [], i + len(batch_urls))
 
-        if i + batch_size < total:
-            print(f"      Waiting {DELAY_BETWEEN_BATCHES}s …")
-            time.sleep(DELAY_BETWEEN_BATCHES)
+        # Only pause after failures; healthy runs go straight to the next batch
+        if consecutive_failures and i + batch_size < total:
+            delay = _backoff_delay(consecutive_failures)
+            print(f"      Backing off {delay:.0f}s …")
+            time.sleep(delay)
 
-    return all_results
+    return n_items
 
 
 # ===========================================================================
@@ -542,27 +558,62 @@ def _checkpoint_path(output_dir):
     return Path(output_dir) / ".scrape_profiles_checkpoint.json"
 
 
-def _save_checkpoint(results, profiles_done, output_dir):
-    """Persist current progress to disk."""
+def _temp_results_path(output_dir):
+    return Path(output_dir) / "temp_profiles_results.jsonl"
+
+
+def _append_jsonl(temp_file, items):
+    """Append *items* to the JSONL temp file in one write, synced to disk."""
+    with open(temp_file, "a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(item, ensure_ascii=False) + "\n" for item in items))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _read_jsonl(temp_file):
+    """Yield items from the JSONL temp file, skipping blank lines."""
+    with open(temp_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _write_json_atomic(path, data):
+    """Write *data* as JSON via a temp file + rename, so a crash never
+    leaves a half-written checkpoint behind."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    tmp.replace(path)
+
+
+def _save_checkpoint(new_items, profiles_done, items_count, output_dir):
+    """Append this batch's items to the temp JSONL and record progress.
+
+    Each checkpoint writes only the new batch, not everything so far.
+    """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    temp_file = output_dir / "temp_profiles_results.json"
-    with open(temp_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False)
+    temp_file = _temp_results_path(output_dir)
+    if new_items:
+        _append_jsonl(temp_file, new_items)
 
-    cp_file = _checkpoint_path(output_dir)
-    with open(cp_file, "w") as f:
-        json.dump({
-            "profiles_processed": profiles_done,
-            "results_file": str(temp_file),
-            "timestamp": datetime.now().isoformat(),
-        }, f, indent=2)
+    _write_json_atomic(_checkpoint_path(output_dir), {
+        "profiles_processed": profiles_done,
+        "items_count": items_count,
+        "results_file": str(temp_file),
+        "timestamp": datetime.now().isoformat(),
+    })
     print(f"      💾 Checkpoint: {profiles_done} profiles done")
 
 
 def _load_checkpoint(output_dir):
-    """Load previous checkpoint if it exists."""
+    """Load previous checkpoint if it exists.
+
+    Previous results stay on disk; only ``items_count`` is resolved here.
+    """
     cp_file = _checkpoint_path(output_dir)
     if not cp_file.exists():
         return None
@@ -571,19 +622,43 @@ def _load_checkpoint(output_dir):
         cp = json.load(f)
 
     temp_file = cp.get("results_file")
-    if temp_file and Path(temp_file).exists():
+    jsonl_file = _temp_results_path(output_dir)
+    if not temp_file or not Path(temp_file).exists():
+        cp["items_count"] = 0
+    elif not temp_file.endswith(".jsonl"):
+        # Legacy checkpoint: one JSON array rewritten every batch; migrate once
         with open(temp_file) as f:
-            cp["previous_results"] = json.load(f)
-    else:
-        cp["previous_results"] = []
+            previous = json.load(f)
+        with open(jsonl_file, "w", encoding="utf-8"):
+            pass
+        _append_jsonl(jsonl_file, previous)
+        cp["items_count"] = len(previous)
+    elif "items_count" not in cp:
+        cp["items_count"] = sum(1 for _ in _read_jsonl(temp_file))
 
     return cp
 
 
+def _truncate_jsonl(path, n_items):
+    """Cut *path* back to its first *n_items* items, streaming line by line."""
+    path = Path(path)
+    path.touch()
+    with open(path, "r+b") as f:
+        kept = 0
+        while kept < n_items:
+            line = f.readline()
+            if not line:
+                break
+            if line.strip():
+                kept += 1
+        f.truncate(f.tell())
+
+
 def _clear_checkpoint(output_dir):
     """Remove checkpoint files after successful completion."""
     for name in [".scrape_profiles_checkpoint.json",
-                 "temp_profiles_results.json"]:
+                 "temp_profiles_results.jsonl",
+                 "temp_profiles_results.json"]:  # also clean legacy format
         p = Path(output_dir) / name
         if p.exists():
             p.unlink()
@@ -609,28 +684,36 @@ def run_scraping(client, df, url_col, output_dir, batch_size,
 
     # Resume handling
     start_from = 0
-    previous_results = []
+    items_count = 0
     if resume:
         cp = _load_checkpoint(output_dir)
         if cp:
             start_from = cp.get("profiles_processed", 0)
-            previous_results = cp.get("previous_results", [])
+            items_count = cp.get("items_count", 0)
             print(f"\n  ✓ Resuming from checkpoint: {start_from} profiles already done")
 
     if start_from >= len(urls):
         print("\n  ✓ All profiles already scraped!")
         return
 
+    # Trim the temp JSONL to exactly the checkpointed results, dropping any
+    # partial batch written after the last checkpoint
+    output_dir.mkdir(parents=True, exist_ok=True)
+    temp_file = _temp_results_path(output_dir)
+    _truncate_jsonl(temp_file, items_count)
+
     # Scrape
     remaining = urls[start_from:]
 
-    def checkpoint_cb(results, done):
-        _save_checkpoint(results, start_from + done, output_dir)
+    def checkpoint_cb(batch_items, done):
+        nonlocal items_count
+        items_count += len(batch_items)
+        _save_checkpoint(batch_items, start_from + done, items_count, output_dir)
 
-    new_results = _scrape_batches(client, remaining, batch_size,
-                                  checkpoint_cb)
+    _scrape_batches(client, remaining, batch_size, checkpoint_cb)
 
-    all_results = previous_results + new_results
+    # Previous and new results are both in the temp JSONL
+    all_results = list(_read_jsonl(temp_file))
 
     # Save final output
     print(f"\n{'=' * 70}")
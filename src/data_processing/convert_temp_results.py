@@ -189,8 +189,8 @@ def main():
     # 2. Parse into posts + profiles
     # ---------------------------------------------------------------------------
     print("Parsing results...", flush=True)
-    posts_list, profiles_list = _parse_results(raw_data, url_metadata)
-    print(f"  Posts rows: {len(posts_list):,}", flush=True)
+    posts_df, profiles_list, norm_meta = _parse_results(raw_data, url_metadata)
+    print(f"  Posts rows: {len(posts_df):,}", flush=True)
     print(f"  Profiles:   {len(profiles_list):,}", flush=True)
 
     # Free raw_data to save memory
@@ -200,13 +200,11 @@ def main():
     # 3. Posts CSV
     # ---------------------------------------------------------------------------
     posts_path = None
-    if posts_list:
-        posts_df = pd.DataFrame(posts_list)
+    if len(posts_df):
         posts_path = output_dir / f"posts_{ts}.csv"
         posts_df.to_csv(posts_path, index=False, encoding="utf-8")
         print(f"  ✓ Posts CSV: {posts_path}  ({len(posts_df):,} rows)", flush=True)
-        del posts_df
-    del posts_list
+    del posts_df
 
     # ---------------------------------------------------------------------------
     # 4. Profiles CSV
@@ -227,7 +225,6 @@ def main():
                     if _normalise_url(u) not in urls_with_posts]
 
     if no_post_urls:
-        norm_meta = {_normalise_url(u): m for u, m in url_metadata.items()}
         no_posts_rows = []
         for url in no_post_urls:
             metas = norm_meta.get(_normalise_url(url), [{}])
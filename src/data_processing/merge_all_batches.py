@@ -100,10 +100,8 @@ def main():
     log(f"  Loaded {len(raw_data):,} items from JSONL")
 
     # Parse into posts + profiles
-    b3_posts_list, _ = _parse_results(raw_data, url_metadata)
+    b3, _, _ = _parse_results(raw_data, url_metadata)
     del raw_data  # free memory
-    b3 = pd.DataFrame(b3_posts_list)
-    del b3_posts_list
     log(f"  Rows: {len(b3):,}  Unique profiles: {b3['profile_url'].nunique():,}")
 
     # ======================================================================
@@ -15,8 +15,15 @@ Output:
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import re
+import json
+import hashlib
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # =========================
@@ -29,6 +36,47 @@ RAW_DATA_PATH = PROJECT_ROOT / "data" / "raw" / "directors.csv"
 PROCESSED_DATA_PATH = PROJECT_ROOT / "data" / "processed"
 OUTPUT_PATH = PROJECT_ROOT / "outputs"
 
+# Rows per chunk when batch mode streams the raw directors data
+CHUNKSIZE = 100_000
+
+# Columns the prototype reads from the raw directors CSV
+PROTOTYPE_COLUMNS = ['gvkey', 'ticker', 'company_name', 'director_name', 'year']
+
+# Batch files already written, so an interrupted run only writes the rest
+PREPARE_STATE_PATH = OUTPUT_PATH / "_prepare_state.json"
+
+# =========================
+# Cleaning Patterns
+# =========================
+# Generational suffixes to preserve
+GEN_SUFFIX_RE = re.compile(r'\b(Jr\.?|Sr\.?|I{1,3}|IV|V|VI|VII|VIII|2nd|3rd|4th)\b', re.IGNORECASE)
+
+# Credentials to remove, as one alternation so each name is scanned once
+CREDENTIALS_RE = re.compile(
+    r'\b(?:PhD\.?|Ph\.D\.?|MD|M\.D\.?|MBA|M\.B\.A\.?|CPA|C\.P\.A\.?|CFA|JD|J\.D\.?'
+    r'|Esq\.?|PE|P\.E\.?|Dr\.?|B\.?Sci\.?|B\.?S\.?|M\.?S\.?|FAICD|Ret\.?|USMC|USAF)\b',
+    re.IGNORECASE,
+)
+
+# Company suffixes, removed in this order (so "Co Inc" loses both)
+COMPANY_SUFFIX_RES = [
+    re.compile(suffix, re.IGNORECASE) for suffix in (
+        r'\s*,?\s*Inc\.?\s*$',
+        r'\s*,?\s*Corp\.?\s*$',
+        r'\s*,?\s*Corporation\s*$',
+        r'\s*,?\s*Ltd\.?\s*$',
+        r'\s*,?\s*LLC\s*$',
+        r'\s*,?\s*L\.L\.C\.?\s*$',
+        r'\s*,?\s*PLC\s*$',
+        r'\s*,?\s*Co\.?\s*$',
+        r'\s*,?\s*Company\s*$',
+    )
+]
+
+# Any run of whitespace, commas and periods collapses to one space
+SEPARATORS_RE = re.compile(r'[\s,.]+')
+WHITESPACE_RE = re.compile(r'\s+')
+
 # =========================
 # Helper Functions
 # =========================
@@ -41,35 +89,18 @@ def clean_director_name(name):
     if pd.isna(name):
         return name
     
-    # Generational suffixes to preserve
-    gen_suffixes = r'\b(Jr\.?|Sr\.?|I{1,3}|IV|V|VI|VII|VIII|2nd|3rd|4th)\b'
-    
     # Extract generational suffix if present
-    gen_match = re.search(gen_suffixes, name, re.IGNORECASE)
+    gen_match = GEN_SUFFIX_RE.search(name)
     gen_suffix = gen_match.group(0) if gen_match else ""
     
-    # Credentials to remove
-    credentials = [
-        r'\bPhD\.?\b', r'\bPh\.D\.?\b', r'\bMD\b', r'\bM\.D\.?\b',
-        r'\bMBA\b', r'\bM\.B\.A\.?\b', r'\bCPA\b', r'\bC\.P\.A\.?\b',
-        r'\bCFA\b', r'\bJD\b', r'\bJ\.D\.?\b', r'\bEsq\.?\b',
-        r'\bPE\b', r'\bP\.E\.?\b', r'\bDr\.?\b',
-        r'\bB\.?Sci\.?\b', r'\bB\.?S\.?\b', r'\bM\.?S\.?\b',
-        r'\bFAICD\b', r'\bRet\.?\b', r'\bUSMC\b', r'\bUSAF\b',
-    ]
-    
-    cleaned = name
-    for cred in credentials:
-        cleaned = re.sub(cred, '', cleaned, flags=re.IGNORECASE)
+    cleaned = CREDENTIALS_RE.sub('', name)
     
     # Remove the generational suffix temporarily (we'll add it back)
     if gen_suffix:
-        cleaned = re.sub(gen_suffixes, '', cleaned, flags=re.IGNORECASE)
+        cleaned = GEN_SUFFIX_RE.sub('', cleaned)
     
     # Clean up extra whitespace, commas, and trailing periods
-    cleaned = re.sub(r'\s*,\s*', ' ', cleaned)
-    cleaned = re.sub(r'\.+', ' ', cleaned)  # Replace periods with spaces
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = SEPARATORS_RE.sub(' ', cleaned)
     cleaned = cleaned.strip()
     
     # Add back generational suffix (without period)
@@ -80,31 +111,50 @@ def clean_director_name(name):
     return cleaned.strip()
 
 
+def clean_director_names(names):
+    """
+    Vectorised clean_director_name over a Series of names (NaN stays NaN).
+    Directors repeat across years and boards, so each distinct name is
+    cleaned once and mapped back.
+    """
+    unique = names.drop_duplicates()
+    gen_suffix = unique.str.extract(GEN_SUFFIX_RE, expand=False)
+    has_gen = gen_suffix.notna()
+    
+    cleaned = unique.str.replace(CREDENTIALS_RE, '', regex=True)
+    cleaned = cleaned.where(~has_gen, cleaned.str.replace(GEN_SUFFIX_RE, '', regex=True))
+    cleaned = cleaned.str.replace(SEPARATORS_RE, ' ', regex=True).str.strip()
+    
+    # Add back generational suffix (without period)
+    with_gen = (cleaned + ' ' + gen_suffix.str.replace('.', '', regex=False)).str.strip()
+    cleaned = cleaned.where(~has_gen, with_gen)
+    return names.map(pd.Series(cleaned.array, index=unique.array))
+
+
 def clean_company_name(name):
     """Standardize company names for better LinkedIn search matching."""
     if pd.isna(name):
         return name
     
-    suffixes = [
-        r'\s*,?\s*Inc\.?\s*$',
-        r'\s*,?\s*Corp\.?\s*$',
-        r'\s*,?\s*Corporation\s*$',
-        r'\s*,?\s*Ltd\.?\s*$',
-        r'\s*,?\s*LLC\s*$',
-        r'\s*,?\s*L\.L\.C\.?\s*$',
-        r'\s*,?\s*PLC\s*$',
-        r'\s*,?\s*Co\.?\s*$',
-        r'\s*,?\s*Company\s*$',
-    ]
-    
     cleaned = name
-    for suffix in suffixes:
-        cleaned = re.sub(suffix, '', cleaned, flags=re.IGNORECASE)
+    for suffix in COMPANY_SUFFIX_RES:
+        cleaned = suffix.sub('', cleaned)
     
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = WHITESPACE_RE.sub(' ', cleaned)
     return cleaned.strip()
 
 
+def clean_company_names(names):
+    """Vectorised clean_company_name, run once per distinct company name."""
+    unique = names.drop_duplicates()
+    cleaned = unique
+    for suffix in COMPANY_SUFFIX_RES:
+        cleaned = cleaned.str.replace(suffix, '', regex=True)
+    
+    cleaned = cleaned.str.replace(WHITESPACE_RE, ' ', regex=True).str.strip()
+    return names.map(pd.Series(cleaned.array, index=unique.array))
+
+
 def generate_search_query(row):
     """Generate a LinkedIn search query from director name and company."""
     name = row.get('director_name_clean', row.get('director_name', ''))
@@ -116,6 +166,117 @@ def generate_search_query(row):
     return f"{name} {company}"
 
 
+def generate_search_queries(df):
+    """Vectorised generate_search_query; NaN where either cleaned name is missing."""
+    return df['director_name_clean'].str.cat(df['company_name_clean'], sep=' ')
+
+
+def _directors_cache_path():
+    """The Parquet copy of the raw CSV, or None if missing or stale."""
+    cache_path = RAW_DATA_PATH.with_suffix('.parquet')
+    if cache_path.exists() and cache_path.stat().st_mtime >= RAW_DATA_PATH.stat().st_mtime:
+        return cache_path
+    return None
+
+
+def load_directors(columns=None):
+    """
+    Load the raw directors data, optionally only *columns*.
+    
+    The CSV is parsed once, by Arrow's multi-threaded reader, into a Parquet
+    copy next to it (directors.parquet), which is rebuilt whenever the CSV
+    is newer than the copy.
+    """
+    cache_path = _directors_cache_path()
+    if cache_path:
+        return pd.read_parquet(cache_path, columns=columns)
+    
+    df = pd.read_csv(RAW_DATA_PATH, engine='pyarrow')
+    df.to_parquet(RAW_DATA_PATH.with_suffix('.parquet'), index=False, compression='zstd')
+    return df if columns is None else df[columns]
+
+
+def iter_directors(chunksize=CHUNKSIZE):
+    """
+    Yield the raw directors data in chunks of *chunksize* rows, from the
+    Parquet copy when it is current, otherwise straight from the CSV.
+    """
+    cache_path = _directors_cache_path()
+    if cache_path:
+        for batch in pq.ParquetFile(cache_path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(RAW_DATA_PATH, chunksize=chunksize)
+
+
+def latest_per_pair(df):
+    """
+    Most recent row per raw director-company pair, in input order.
+    Ties keep the earlier row; a missing year ranks below any year.
+    """
+    year = df['year'].fillna(-np.inf) if df['year'].hasnans else df['year']
+    idx = year.groupby([df['director_name'], df['company_name']], sort=False).idxmax()
+    return df.loc[np.sort(idx.to_numpy())]
+
+
+def _batches_hash(queries_df, batch_size):
+    """Fingerprint of the batch contents, to tell whether saved state still applies."""
+    row_hashes = pd.util.hash_pandas_object(queries_df, index=False).to_numpy()
+    return hashlib.sha256(row_hashes.tobytes() + str(batch_size).encode()).hexdigest()
+
+
+def _load_prepare_state(config_hash):
+    """Batch numbers already written for *config_hash* (empty if none or stale)."""
+    try:
+        with open(PREPARE_STATE_PATH) as f:
+            state = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return set()
+    if state.get('config_hash') != config_hash:
+        return set()
+    return set(state.get('written_batches', []))
+
+
+def _save_prepare_state(config_hash, written_batches):
+    """Write the state file via a temp file + rename, so it is never half-written."""
+    tmp_path = PREPARE_STATE_PATH.with_suffix('.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump({'config_hash': config_hash, 'written_batches': sorted(written_batches)}, f)
+    tmp_path.replace(PREPARE_STATE_PATH)
+
+
+def write_batch_files(queries_df, batch_size, max_workers=8):
+    """
+    Write queries_df to batch_001_queries.csv, batch_002_queries.csv, ...
+    in OUTPUT_PATH, *batch_size* rows each, several files at a time.
+    Arrow's CSV writer quotes every string value and releases the GIL,
+    so the threads write in parallel.
+    
+    Finished batches are recorded in PREPARE_STATE_PATH; a rerun over the
+    same queries skips batches that were already written and still exist.
+    Returns (n_rows, skipped) for each batch, in batch order.
+    """
+    n_batches = (len(queries_df) + batch_size - 1) // batch_size
+    config_hash = _batches_hash(queries_df, batch_size)
+    written = _load_prepare_state(config_hash)
+    lock = threading.Lock()
+    
+    def write_batch(i):
+        batch = queries_df.iloc[i * batch_size:(i + 1) * batch_size]
+        batch_path = OUTPUT_PATH / f"batch_{i+1:03d}_queries.csv"
+        if i + 1 in written and batch_path.exists():
+            return len(batch), True
+        table = pa.Table.from_pandas(batch, preserve_index=False)
+        pacsv.write_csv(table, batch_path)
+        with lock:
+            written.add(i + 1)
+            _save_prepare_state(config_hash, written)
+        return len(batch), False
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, n_batches))) as executor:
+        return list(executor.map(write_batch, range(n_batches)))
+
+
 # =========================
 # Prototype Mode
 # =========================
@@ -129,21 +290,20 @@ def run_prototype(company_search):
     # Load data
     print(f"\n[1/4] Loading directors data...")
     print(f"      From: {RAW_DATA_PATH}")
-    df = pd.read_csv(RAW_DATA_PATH)
+    df = load_directors(PROTOTYPE_COLUMNS)
     print(f"      Loaded {len(df):,} records")
     
-    # Clean the data
-    print(f"\n[2/4] Cleaning names...")
-    df['director_name_clean'] = df['director_name'].apply(clean_director_name)
-    df['company_name_clean'] = df['company_name'].apply(clean_company_name)
-    
-    # Find matching companies
-    companies = df['company_name'].unique()
-    matches = [c for c in companies if company_search.lower() in c.lower()]
+    # Find matching companies (lowercased once for both searches below)
+    companies = df['company_name'].dropna().unique()
+    companies_lower = pd.Series(companies).str.lower()
+    matches = list(companies[companies_lower.str.contains(company_search.lower(), regex=False).to_numpy()])
     
     if not matches:
         print(f"\n✗ No companies found matching '{company_search}'")
-        suggestions = [c for c in companies if any(word.lower() in c.lower() for word in company_search.split())][:10]
+        mentioned = np.zeros(len(companies), dtype=bool)
+        for word in company_search.lower().split():
+            mentioned |= companies_lower.str.contains(word, regex=False).to_numpy()
+        suggestions = list(companies[mentioned][:10])
         if suggestions:
             print("\nDid you mean one of these?")
             for s in suggestions:
@@ -151,7 +311,7 @@ def run_prototype(company_search):
         return None
     
     if len(matches) > 1:
-        print(f"\n[3/4] Found {len(matches)} matching companies:")
+        print(f"\n[2/4] Found {len(matches)} matching companies:")
         for i, m in enumerate(matches[:10], 1):
             print(f"      {i}. {m}")
         
@@ -165,15 +325,22 @@ def run_prototype(company_search):
     
     print(f"\n✓ Selected: {selected_company}")
     
-    # Filter to this company
-    company_df = df[df['company_name'] == selected_company].copy()
+    # Filter to this company (boolean indexing already returns a new frame)
+    company_df = df[df['company_name'] == selected_company]
+    
+    # Clean only this company's rows
+    print(f"\n[3/4] Cleaning names...")
+    company_df = company_df.assign(
+        director_name_clean=clean_director_names(company_df['director_name']),
+        company_name_clean=clean_company_names(company_df['company_name']),
+    )
     company_df = (
         company_df.sort_values('year', ascending=False)
         .drop_duplicates(subset=['director_name_clean'])
     )
     
     # Generate search queries
-    company_df['search_query'] = company_df.apply(generate_search_query, axis=1)
+    company_df = company_df.assign(search_query=generate_search_queries(company_df))
     
     # Display directors
     print(f"\n[4/4] Generated queries for {len(company_df)} directors:")
@@ -216,32 +383,37 @@ def run_batch_mode():
     PROCESSED_DATA_PATH.mkdir(parents=True, exist_ok=True)
     OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
     
-    # Load data
+    # Load data, keeping only the most recent row per raw director-company
+    # pair as each chunk arrives, so memory tracks pairs rather than rows.
+    # Rows missing either name can't form a query.
     print("\n[1/5] Loading directors data...")
     print(f"      From: {RAW_DATA_PATH}")
-    df = pd.read_csv(RAW_DATA_PATH)
-    print(f"      Loaded {len(df):,} records")
+    n_records = 0
+    df = None
+    for chunk in iter_directors():
+        n_records += len(chunk)
+        chunk = chunk.dropna(subset=['director_name', 'company_name'])
+        df = latest_per_pair(chunk if df is None else pd.concat([df, chunk], ignore_index=True))
+    df = df.sort_values('year', ascending=False, kind='stable')
+    print(f"      Loaded {n_records:,} records")
+    print(f"      Raw director-company pairs: {len(df):,}")
     
     # Clean names
     print("\n[2/5] Cleaning director names...")
-    df['director_name_clean'] = df['director_name'].apply(clean_director_name)
+    df['director_name_clean'] = clean_director_names(df['director_name'])
     
     # Clean company names
     print("\n[3/5] Cleaning company names...")
-    df['company_name_clean'] = df['company_name'].apply(clean_company_name)
+    df['company_name_clean'] = clean_company_names(df['company_name'])
     
     # Get current directors
     print("\n[4/5] Extracting current directors...")
-    current_directors = (
-        df.sort_values('year', ascending=False)
-        .drop_duplicates(subset=['director_name_clean', 'company_name_clean'])
-    )
+    current_directors = df.drop_duplicates(subset=['director_name_clean', 'company_name_clean'])
     print(f"      Unique director-company pairs: {len(current_directors):,}")
     
     # Generate search queries
     print("\n[5/5] Generating search queries...")
-    current_directors['search_query'] = current_directors.apply(generate_search_query, axis=1)
-    current_directors = current_directors.dropna(subset=['search_query'])
+    current_directors['search_query'] = generate_search_queries(current_directors)
     print(f"      Valid search queries: {len(current_directors):,}")
     
     # Save outputs
@@ -259,14 +431,8 @@ def run_batch_mode():
     n_batches = (len(queries_df) + batch_size - 1) // batch_size
     
     print(f"\n[✓] Creating {n_batches} batch files:")
-    for i in range(n_batches):
-        start_idx = i * batch_size
-        end_idx = min((i + 1) * batch_size, len(queries_df))
-        batch = queries_df.iloc[start_idx:end_idx]
-        
-        batch_path = OUTPUT_PATH / f"batch_{i+1:03d}_queries.csv"
-        batch.to_csv(batch_path, index=False)
-        print(f"      Batch {i+1}: {len(batch)} queries")
+    for i, (n_rows, skipped) in enumerate(write_batch_files(queries_df, batch_size)):
+        print(f"      Batch {i+1}: {n_rows} queries" + (" (already written)" if skipped else ""))
     
     # Summary
     print("\n" + "=" * 60)
@@ -15,9 +15,15 @@ Usage:
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import re
 import os
+import json
+import hashlib
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # =========================
 # Configuration
@@ -32,6 +38,48 @@ OUTPUT_PATH = "../../outputs/sp500_batches/"
 # Batch size for Google API (1000 queries per batch)
 BATCH_SIZE = 1000
 
+# Batch files already written, so an interrupted run only writes the rest
+PREPARE_STATE_FILE = "_prepare_state.json"
+
+# Columns prototype mode reads (the full run keeps every column)
+PROTOTYPE_COLUMNS = ['gvkey', 'ticker', 'company_name', 'director_name']
+
+# =========================
+# Cleaning Patterns
+# =========================
+# Generational suffixes to preserve
+GEN_SUFFIX_RE = re.compile(r'\b(Jr\.?|Sr\.?|I{1,3}|IV|V|VI|VII|VIII|2nd|3rd|4th)\b', re.IGNORECASE)
+
+# Credentials to remove, in this order.  Periods are kept in the cleaned
+# name, so "M.D.MD" depends on the order and one alternation would differ.
+CREDENTIAL_RES = [
+    re.compile(cred, re.IGNORECASE) for cred in (
+        r'\bPhD\.?\b', r'\bPh\.D\.?\b', r'\bMD\b', r'\bM\.D\.?\b',
+        r'\bMBA\b', r'\bM\.B\.A\.?\b', r'\bCPA\b', r'\bC\.P\.A\.?\b',
+        r'\bCFA\b', r'\bJD\b', r'\bJ\.D\.?\b', r'\bEsq\.?\b',
+        r'\bPE\b', r'\bP\.E\.?\b', r'\bDr\.?\b',
+    )
+]
+
+# Common company suffixes, removed in this order (so "Co Inc" loses both)
+COMPANY_SUFFIX_RES = [
+    re.compile(suffix, re.IGNORECASE) for suffix in (
+        r'\s*,?\s*Inc\.?\s*$',
+        r'\s*,?\s*Corp\.?\s*$',
+        r'\s*,?\s*Corporation\s*$',
+        r'\s*,?\s*Ltd\.?\s*$',
+        r'\s*,?\s*LLC\s*$',
+        r'\s*,?\s*L\.L\.C\.?\s*$',
+        r'\s*,?\s*PLC\s*$',
+        r'\s*,?\s*Co\.?\s*$',
+        r'\s*,?\s*Company\s*$',
+    )
+]
+
+# Any run of whitespace and commas collapses to one space
+SEPARATORS_RE = re.compile(r'[\s,]+')
+WHITESPACE_RE = re.compile(r'\s+')
+
 # =========================
 # Helper Functions
 # =========================
@@ -44,32 +92,20 @@ def clean_director_name(name):
     if pd.isna(name):
         return name
     
-    # Generational suffixes to preserve
-    gen_suffixes = r'\b(Jr\.?|Sr\.?|I{1,3}|IV|V|VI|VII|VIII|2nd|3rd|4th)\b'
-    
     # Extract generational suffix if present
-    gen_match = re.search(gen_suffixes, name, re.IGNORECASE)
+    gen_match = GEN_SUFFIX_RE.search(name)
     gen_suffix = gen_match.group(0) if gen_match else ""
     
-    # Credentials to remove
-    credentials = [
-        r'\bPhD\.?\b', r'\bPh\.D\.?\b', r'\bMD\b', r'\bM\.D\.?\b',
-        r'\bMBA\b', r'\bM\.B\.A\.?\b', r'\bCPA\b', r'\bC\.P\.A\.?\b',
-        r'\bCFA\b', r'\bJD\b', r'\bJ\.D\.?\b', r'\bEsq\.?\b',
-        r'\bPE\b', r'\bP\.E\.?\b', r'\bDr\.?\b'
-    ]
-    
     cleaned = name
-    for cred in credentials:
-        cleaned = re.sub(cred, '', cleaned, flags=re.IGNORECASE)
+    for cred in CREDENTIAL_RES:
+        cleaned = cred.sub('', cleaned)
     
     # Remove the generational suffix temporarily (we'll add it back)
     if gen_suffix:
-        cleaned = re.sub(gen_suffixes, '', cleaned, flags=re.IGNORECASE)
+        cleaned = GEN_SUFFIX_RE.sub('', cleaned)
     
     # Clean up extra whitespace and commas
-    cleaned = re.sub(r'\s*,\s*', ' ', cleaned)
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = SEPARATORS_RE.sub(' ', cleaned)
     cleaned = cleaned.strip()
     
     # Add back generational suffix
@@ -79,6 +115,27 @@ def clean_director_name(name):
     return cleaned.strip()
 
 
+def clean_director_names(names):
+    """
+    Vectorised clean_director_name over a Series of names (NaN stays NaN).
+    Directors repeat across boards, so each distinct name is cleaned once
+    and mapped back.
+    """
+    unique = names.drop_duplicates()
+    gen_suffix = unique.str.extract(GEN_SUFFIX_RE, expand=False)
+    has_gen = gen_suffix.notna()
+    
+    cleaned = unique
+    for cred in CREDENTIAL_RES:
+        cleaned = cleaned.str.replace(cred, '', regex=True)
+    cleaned = cleaned.where(~has_gen, cleaned.str.replace(GEN_SUFFIX_RE, '', regex=True))
+    cleaned = cleaned.str.replace(SEPARATORS_RE, ' ', regex=True).str.strip()
+    
+    # Add back generational suffix
+    cleaned = cleaned.where(~has_gen, (cleaned + ' ' + gen_suffix).str.strip())
+    return names.map(pd.Series(cleaned.array, index=unique.array))
+
+
 def clean_company_name(name):
     """
     Standardize company names for better LinkedIn search matching.
@@ -86,29 +143,29 @@ def clean_company_name(name):
     if pd.isna(name):
         return name
     
-    # Common suffixes to remove/standardize
-    suffixes = [
-        r'\s*,?\s*Inc\.?\s*$',
-        r'\s*,?\s*Corp\.?\s*$',
-        r'\s*,?\s*Corporation\s*$',
-        r'\s*,?\s*Ltd\.?\s*$',
-        r'\s*,?\s*LLC\s*$',
-        r'\s*,?\s*L\.L\.C\.?\s*$',
-        r'\s*,?\s*PLC\s*$',
-        r'\s*,?\s*Co\.?\s*$',
-        r'\s*,?\s*Company\s*$',
-    ]
-    
     cleaned = name
-    for suffix in suffixes:
-        cleaned = re.sub(suffix, '', cleaned, flags=re.IGNORECASE)
+    for suffix in COMPANY_SUFFIX_RES:
+        cleaned = suffix.sub('', cleaned)
     
     # Clean up whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = WHITESPACE_RE.sub(' ', cleaned)
     
     return cleaned.strip()
 
 
+def clean_company_names(names):
+    """
+    Vectorised clean_company_name, run once per distinct company name.
+    """
+    unique = names.drop_duplicates()
+    cleaned = unique
+    for suffix in COMPANY_SUFFIX_RES:
+        cleaned = cleaned.str.replace(suffix, '', regex=True)
+    
+    cleaned = cleaned.str.replace(WHITESPACE_RE, ' ', regex=True).str.strip()
+    return names.map(pd.Series(cleaned.array, index=unique.array))
+
+
 def generate_search_query(row):
     """
     Generate a LinkedIn search query from director name and company.
@@ -123,6 +180,118 @@ def generate_search_query(row):
     return f"{name} {company}"
 
 
+def generate_search_queries(df):
+    """
+    Vectorised generate_search_query over the cleaned name columns.
+    NaN where either name is missing.
+    """
+    return df['director_name_clean'].str.cat(df['company_name_clean'], sep=' ')
+
+
+def load_directors(data_path=SP500_DATA_PATH, columns=None):
+    """
+    Load the S&P 500 director data, optionally only *columns*.
+    
+    The CSV is parsed once, by Arrow's multi-threaded reader, into a
+    Parquet copy next to it (e.g. sp500_current_directors.parquet),
+    rebuilt whenever the CSV is newer than the copy.
+    """
+    cache_path = os.path.splitext(data_path)[0] + '.parquet'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(data_path):
+        return pd.read_parquet(cache_path, columns=columns)
+    
+    df = pd.read_csv(data_path, engine='pyarrow')
+    df.to_parquet(cache_path, index=False, compression='zstd')
+    return df if columns is None else df[columns]
+
+
+def load_cleaned_directors(data_path=SP500_DATA_PATH):
+    """
+    Load director data with cleaned names and search queries.
+    
+    The cleaned frame is cached as Parquet next to the source CSV
+    (e.g. sp500_current_directors_cleaned.parquet) and rebuilt whenever
+    the CSV is newer than the cache.
+    """
+    cache_path = os.path.splitext(data_path)[0] + '_cleaned.parquet'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(data_path):
+        return pd.read_parquet(cache_path)
+    
+    df = load_directors(data_path)
+    df['director_name_clean'] = clean_director_names(df['director_name'])
+    df['company_name_clean'] = clean_company_names(df['company_name'])
+    df['search_query'] = generate_search_queries(df)
+    df.to_parquet(cache_path, index=False)
+    return df
+
+
+def write_query_csv(queries_df, path):
+    """
+    Write a search-query frame to CSV with Arrow's C++ writer, which
+    quotes every string value and releases the GIL while writing.
+    """
+    pacsv.write_csv(pa.Table.from_pandas(queries_df, preserve_index=False), path)
+
+
+def _batches_hash(queries_df, batch_size):
+    """Fingerprint of the batch contents, to tell whether saved state still applies."""
+    row_hashes = pd.util.hash_pandas_object(queries_df, index=False).to_numpy()
+    return hashlib.sha256(row_hashes.tobytes() + str(batch_size).encode()).hexdigest()
+
+
+def _load_prepare_state(state_path, config_hash):
+    """Batch numbers already written for *config_hash* (empty if none or stale)."""
+    try:
+        with open(state_path) as f:
+            state = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return set()
+    if state.get('config_hash') != config_hash:
+        return set()
+    return set(state.get('written_batches', []))
+
+
+def _save_prepare_state(state_path, config_hash, written_batches):
+    """Write the state file via a temp file + rename, so it is never half-written."""
+    tmp_path = state_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({'config_hash': config_hash, 'written_batches': sorted(written_batches)}, f)
+    os.replace(tmp_path, state_path)
+
+
+def write_batch_files(queries_df, output_dir=OUTPUT_PATH, batch_size=BATCH_SIZE, max_workers=8):
+    """
+    Write queries_df to batch_001_queries.csv, batch_002_queries.csv, ...
+    in output_dir, several files at a time.
+    
+    Finished batches are recorded in output_dir/_prepare_state.json; a rerun
+    over the same queries skips batches that were already written and
+    still exist.
+    
+    Returns:
+        List of (batch_path, n_rows, skipped) tuples, in batch order
+    """
+    n_batches = (len(queries_df) + batch_size - 1) // batch_size
+    state_path = os.path.join(output_dir, PREPARE_STATE_FILE)
+    config_hash = _batches_hash(queries_df, batch_size)
+    written = _load_prepare_state(state_path, config_hash)
+    lock = threading.Lock()
+    
+    def write_batch(i):
+        batch = queries_df.iloc[i * batch_size:(i + 1) * batch_size]
+        batch_path = os.path.join(output_dir, f"batch_{i+1:03d}_queries.csv")
+        if i + 1 in written and os.path.exists(batch_path):
+            return batch_path, len(batch), True
+        write_query_csv(batch, batch_path)
+        with lock:
+            written.add(i + 1)
+            _save_prepare_state(state_path, config_hash, written)
+        return batch_path, len(batch), False
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, n_batches))) as executor:
+        return list(executor.map(write_batch, range(n_batches)))
+
+
 # =========================
 # Main Processing
 # =========================
@@ -144,13 +313,16 @@ def main():
         print("\nPlease run build_sp500_directors.py first to generate the S&P 500 dataset.")
         return
     
-    df = pd.read_csv(SP500_DATA_PATH)
+    df = load_directors()
     print(f"      Loaded {len(df):,} director-company pairs")
     print(f"      Columns: {list(df.columns)}")
     
+    # Rows missing either name can't form a query; drop them before cleaning
+    df = df.dropna(subset=['director_name', 'company_name'])
+    
     # Clean names
     print("\n[2/5] Cleaning director names...")
-    df['director_name_clean'] = df['director_name'].apply(clean_director_name)
+    df['director_name_clean'] = clean_director_names(df['director_name'])
     
     # Show examples
     sample = df[['director_name', 'director_name_clean']].drop_duplicates().head(5)
@@ -161,14 +333,11 @@ def main():
     
     # Clean company names
     print("\n[3/5] Cleaning company names...")
-    df['company_name_clean'] = df['company_name'].apply(clean_company_name)
+    df['company_name_clean'] = clean_company_names(df['company_name'])
     
     # Generate search queries
     print("\n[4/5] Generating search queries...")
-    df['search_query'] = df.apply(generate_search_query, axis=1)
-    
-    # Remove any null queries
-    df = df.dropna(subset=['search_query'])
+    df['search_query'] = generate_search_queries(df)
     print(f"      Valid search queries: {len(df):,}")
     
     # =========================
@@ -185,7 +354,7 @@ def main():
     # Search queries only (for Google API)
     queries_df = df[['search_query', 'director_name_clean', 'company_name_clean', 'gvkey', 'ticker']].copy()
     queries_output_path = os.path.join(OUTPUT_PATH, "all_search_queries.csv")
-    queries_df.to_csv(queries_output_path, index=False)
+    write_query_csv(queries_df, queries_output_path)
     print(f"[✓] All queries: {queries_output_path}")
     
     # Batch files for Google API
@@ -193,14 +362,9 @@ def main():
     
     print(f"\n[✓] Creating {n_batches} batch files ({BATCH_SIZE} queries each):")
     
-    for i in range(n_batches):
-        start_idx = i * BATCH_SIZE
-        end_idx = min((i + 1) * BATCH_SIZE, len(queries_df))
-        batch = queries_df.iloc[start_idx:end_idx]
-        
-        batch_path = os.path.join(OUTPUT_PATH, f"batch_{i+1:03d}_queries.csv")
-        batch.to_csv(batch_path, index=False)
-        print(f"      Batch {i+1}: {len(batch):,} queries → {batch_path}")
+    for i, (batch_path, n_rows, skipped) in enumerate(write_batch_files(queries_df)):
+        note = " (already written)" if skipped else ""
+        print(f"      Batch {i+1}: {n_rows:,} queries → {batch_path}{note}")
     
     # =========================
     # Summary
@@ -233,24 +397,24 @@ def prototype_mode(df, company_search=None):
     print("🔬 PROTOTYPE MODE - S&P 500")
     print("=" * 60)
     
-    # Clean the data first
-    df['director_name_clean'] = df['director_name'].apply(clean_director_name)
-    df['company_name_clean'] = df['company_name'].apply(clean_company_name)
-    
-    # Get unique companies
-    companies = df['company_name'].unique()
+    # Get unique companies (lowercased once for the searches below)
+    companies = df['company_name'].dropna().unique()
+    companies_lower = pd.Series(companies).str.lower()
     
     if company_search is None:
         print(f"\nTotal S&P 500 companies in dataset: {len(companies):,}")
         company_search = input("\nEnter company name to search: ").strip()
     
     # Find matching companies
-    matches = [c for c in companies if company_search.lower() in c.lower()]
+    matches = list(companies[companies_lower.str.contains(company_search.lower(), regex=False).to_numpy()])
     
     if not matches:
         print(f"\n❌ No companies found matching '{company_search}'")
         print("\nTry a broader search term, or check these similar names:")
-        suggestions = [c for c in companies if any(word.lower() in c.lower() for word in company_search.split())][:10]
+        mentioned = np.zeros(len(companies), dtype=bool)
+        for word in company_search.lower().split():
+            mentioned |= companies_lower.str.contains(word, regex=False).to_numpy()
+        suggestions = list(companies[mentioned][:10])
         for s in suggestions:
             print(f"  - {s}")
         return None
@@ -272,11 +436,17 @@ def prototype_mode(df, company_search=None):
     
     print(f"\n✓ Selected: {selected_company}")
     
-    # Filter to this company
-    company_df = df[df['company_name'] == selected_company].copy()
+    # Filter to this company (boolean indexing already returns a new frame)
+    company_df = df[df['company_name'] == selected_company]
+    
+    # Clean only this company's rows
+    company_df = company_df.assign(
+        director_name_clean=clean_director_names(company_df['director_name']),
+        company_name_clean=clean_company_names(company_df['company_name']),
+    )
     
     # Generate search queries
-    company_df['search_query'] = company_df.apply(generate_search_query, axis=1)
+    company_df = company_df.assign(search_query=generate_search_queries(company_df))
     
     # Display results
     print(f"\n{'=' * 60}")
@@ -338,7 +508,7 @@ Run build_sp500_directors.py first if you haven't already.
             print("\nPlease run build_sp500_directors.py first.")
             exit(1)
             
-        df = pd.read_csv(SP500_DATA_PATH)
+        df = load_directors(columns=PROTOTYPE_COLUMNS)
         print(f"      Loaded {len(df):,} records")
         
         prototype_mode(df, args.company)